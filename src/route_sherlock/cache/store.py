@@ -5,8 +5,8 @@ Simple caching interface for API responses. Two implementations:
 
 - ``MemoryCache``: process-local, used by tests and short-lived runs.
 - ``FileCache``: JSON files under ``~/.cache/route-sherlock/``, persistent
-  across runs. Zero external dependencies; cache directory is human-readable
-  and trivially clearable with ``rm -rf``.
+  across runs. Zero required dependencies (uses ``orjson`` when installed);
+  cache directory is human-readable and trivially clearable with ``rm -rf``.
 """
 from __future__ import annotations
 
@@ -19,6 +19,11 @@ from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional: pip install 'route-sherlock[fast]'
+    orjson = None
+
 
 class OfflineCacheMiss(Exception):
     """Raised when a collector running in offline mode has no cached entry."""
@@ -143,7 +148,8 @@ class FileCache(Cache):
         if not path.exists():
             return None
         try:
-            entry = json.loads(path.read_text())
+            raw = path.read_bytes()
+            entry = orjson.loads(raw) if orjson else json.loads(raw)
         except (OSError, json.JSONDecodeError):
             # Corrupt or unreadable: treat as miss; don't crash the request.
             return None
@@ -169,8 +175,11 @@ class FileCache(Cache):
         # Atomic write: temp file in same directory, then rename.
         fd, tmp_path = tempfile.mkstemp(prefix=".tmp-", dir=self.directory)
         try:
-            with os.fdopen(fd, "w") as fh:
-                json.dump(payload, fh)
+            with os.fdopen(fd, "wb") as fh:
+                if orjson:
+                    fh.write(orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS))
+                else:
+                    fh.write(json.dumps(payload).encode("utf-8"))
             os.replace(tmp_path, target)
         except Exception:
             # Clean up tmp if rename failed.
@@ -558,13 +558,14 @@ async def run_investigate(resource: str, time_str: str | None, duration: str, us
             ) as progress:
                 progress.add_task("Generating AI analysis...", total=None)
 
-                report = await synth.synthesize_from_raw(
-                    asn=resource,
-                    updates=update_data,
-                    history=None,
-                    start_time=start_time,
-                    end_time=end_time,
-                )
+                async with synth:
+                    report = await synth.synthesize_from_raw(
+                        asn=resource,
+                        updates=update_data,
+                        history=None,
+                        start_time=start_time,
+                        end_time=end_time,
+                    )
 
             console.print(Panel(
                 Markdown(report),
@@ -900,7 +901,8 @@ def run_backtest(prefix: str, origin: str, time_str: str, duration: str, use_ai:
                 synth = Synthesizer()
 
                 async def get_analysis():
-                    return await synth.synthesize_incident(report)
+                    async with synth:
+                        return await synth.synthesize_incident(report)
 
                 with Progress(
                     SpinnerColumn(),
@@ -935,7 +937,7 @@ async def _gather_peer_risk_data(
     cache: Cache | None = None,
     offline: bool = False,
     quiet: bool = False,
-    cache_ttl: int = 86400,
+    cache_ttl: int | None = None,
 ) -> dict[str, Any]:
     """Run the full peer-risk data-collection pipeline.
 
@@ -1305,7 +1307,7 @@ async def run_peer_risk(
     offline: bool = False,
     json_output: bool = False,
     output_path: str | None = None,
-    cache_ttl: int = 86400,
+    cache_ttl: int | None = None,
 ):
     """
     Evaluate peering risk for an ASN.
@@ -1495,7 +1497,8 @@ async def run_peer_risk(
                     transient=True,
                 ) as progress:
                     progress.add_task("Generating AI risk assessment...", total=None)
-                    analysis = await synth.synthesize(PEER_RISK_PROMPT, risk_data)
+                    async with synth:
+                        analysis = await synth.synthesize(PEER_RISK_PROMPT, risk_data)
 
                 console.print(Panel(
                     Markdown(analysis),
@@ -163,9 +163,10 @@ def peer_risk(
         None, "--output",
         help="With --json, write the JSON to this file instead of stdout.",
     ),
-    cache_ttl: int = typer.Option(
-        86400, "--cache-ttl",
-        help="How long to keep cached responses, in seconds. Default 24h. "
+    cache_ttl: Optional[int] = typer.Option(
+        None, "--cache-ttl",
+        help="How long to keep cached responses, in seconds. Default 24h, "
+             "shorter for fast-changing live data (routing status, RPKI). "
              "Set to 0 to bypass the cache; set to a large value (e.g. 604800 = 1 week) "
              "for batch / research runs that should not re-fetch mid-run. "
              "Time-bounded historical queries (BGP updates with explicit start/end) "
@@ -19,6 +19,11 @@ from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: pip install 'route-sherlock[fast]'
+    orjson = None
+
 from route_sherlock.models.atlas import (
     Anchor,
     AnchorList,
@@ -164,7 +169,7 @@ class AtlasClient:
                     raise AtlasRateLimitError("Rate limit exceeded")
 
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content) if orjson else response.json()
 
                 # Cache successful response
                 if self.cache:
@@ -12,26 +12,45 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import atexit
+import base64
+import hashlib
+import logging
 import random
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterable
 from typing import Any
 from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: pip install 'route-sherlock[fast]'
+    orjson = None
+
 from route_sherlock.models.peeringdb import (
     CommonIX,
     Facility,
+    FacilityList,
     InternetExchange,
     IXLan,
     IXLanPrefix,
+    IXList,
     Network,
     NetworkFacility,
     NetworkIXLan,
+    NetworkList,
     NetworkPresence,
     Organization,
     PeeringOpportunity,
 )
 from route_sherlock.cache.store import Cache, OfflineCacheMiss
+from route_sherlock.collectors.loop import BackgroundLoop
+
+logger = logging.getLogger(__name__)
 
 
 class PeeringDBError(Exception):
@@ -54,6 +73,10 @@ class PeeringDBNotFoundError(PeeringDBError):
     pass
 
 
+# Marks a remembered 404 in the in-process response copy.
+_NOT_FOUND: dict[str, Any] = {}
+
+
 class PeeringDBClient:
     """
     Async client for PeeringDB API.
@@ -73,15 +96,74 @@ class PeeringDBClient:
 
     BASE_URL = "https://www.peeringdb.com/api"
 
+    # Per-object-type cache TTLs (seconds), keyed by the first path segment
+    # of the endpoint. Organizations and facilities almost never change; IX
+    # records and their LANs/prefixes change on the order of days; network
+    # records and their IX/facility presence change most often. Applied only
+    # when the caller leaves ``cache_ttl`` unset: an explicit ``cache_ttl``
+    # covers every endpoint. Anything not listed uses ``cache_ttl``.
+    DEFAULT_TTLS: dict[str, int] = {
+        "org": 7 * 86400,
+        "fac": 7 * 86400,
+        "ix": 3 * 86400,
+        "ixlan": 3 * 86400,
+        "ixpfx": 3 * 86400,
+        "net": 12 * 3600,
+        "netixlan": 6 * 3600,
+        "netfac": 6 * 3600,
+    }
+
+    # TTL when the caller does not pass ``cache_ttl``. 24h — PeeringDB
+    # profiles change rarely.
+    DEFAULT_CACHE_TTL = 86400
+
+    # Field projections for the list endpoints that can return thousands of
+    # rows for a large network or IX. They keep every field the models and
+    # their callers read and drop free-text notes and audit timestamps,
+    # which shrinks the payload and JSON decode work.
+    NETIXLAN_FIELDS = (
+        "id", "net_id", "ix_id", "ixlan_id", "name", "speed", "asn",
+        "ipaddr4", "ipaddr6", "is_rs_peer", "operational", "status",
+    )
+    NETFAC_FIELDS = (
+        "id", "net_id", "fac_id", "name", "city", "country", "local_asn", "status",
+    )
+
+    # Maximum number of values per ``<field>__in=`` query when bulk-fetching
+    # records by ID/ASN; keeps request URLs comfortably short.
+    IN_QUERY_BATCH_SIZE = 100
+
+    # Non-retryable HTTP statuses and the errors they raise; anything else
+    # outside 2xx goes through the retry loop.
+    _STATUS_ERRORS: dict[int, tuple[type[PeeringDBError], str]] = {
+        401: (PeeringDBAuthError, "Authentication failed"),
+        403: (PeeringDBAuthError, "Access denied"),
+        404: (PeeringDBNotFoundError, "Resource not found: {endpoint}"),
+    }
+
+    # How long past its TTL a cached response with an ETag/Last-Modified is
+    # kept for conditional revalidation (and for offline mode).
+    REVALIDATE_WINDOW = 7 * 86400
+
+    # How long a 404 is remembered, so deleted IDs in fan-out lookups are not
+    # re-requested on every call. Capped by the client's ``cache_ttl``.
+    NOT_FOUND_TTL = 300
+
+    # Bound on the in-process copy of cached responses kept in front of
+    # ``cache``; least recently used entries are evicted first.
+    MEMO_MAX_ENTRIES = 4096
+
     def __init__(
         self,
         api_key: str | None = None,
         username: str | None = None,
         password: str | None = None,
         cache: Cache | None = None,
-        cache_ttl: int = 86400,  # 24h default — PeeringDB profiles change rarely
+        cache_ttl: int | None = None,
+        cache_ttl_overrides: dict[str, int] | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
+        backoff_factor: float = 1.0,
         offline: bool = False,
     ):
         """
@@ -92,9 +174,16 @@ class PeeringDBClient:
             username: PeeringDB username (alternative auth)
             password: PeeringDB password (with username)
             cache: Optional cache instance for response caching
-            cache_ttl: Cache time-to-live in seconds
+            cache_ttl: Cache time-to-live in seconds for every endpoint.
+                Defaults to ``DEFAULT_CACHE_TTL`` with the per-object
+                ``DEFAULT_TTLS`` applied on top.
+            cache_ttl_overrides: Per-endpoint TTLs (e.g. ``{"netixlan": 3600}``).
+                These apply whether or not ``cache_ttl`` is given.
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
+            backoff_factor: Multiplier for the exponential retry delay
+                (``backoff_factor * 2^attempt`` seconds) used when the
+                server sends no Retry-After header
             offline: If True, only serve from cache; raise
                 ``OfflineCacheMiss`` on cache miss instead of making a
                 network request.
@@ -103,25 +192,35 @@ class PeeringDBClient:
         self.username = username
         self.password = password
         self.cache = cache
-        self.cache_ttl = cache_ttl
+        if cache_ttl is None:
+            self.cache_ttl = self.DEFAULT_CACHE_TTL
+            self.cache_ttl_overrides = {**self.DEFAULT_TTLS, **(cache_ttl_overrides or {})}
+        else:
+            self.cache_ttl = cache_ttl
+            self.cache_ttl_overrides = dict(cache_ttl_overrides or {})
         self.timeout = timeout
         self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
         self.offline = offline
         self._client: httpx.AsyncClient | None = None
+        self._inflight: dict[str, asyncio.Future[dict[str, Any]]] = {}
+        self._memo: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
 
     async def __aenter__(self) -> "PeeringDBClient":
         headers = {"Accept": "application/json"}
 
-        auth = None
+        # Credentials are fixed for the client's lifetime, so encode the
+        # Authorization header once rather than per request via httpx auth.
         if self.api_key:
             headers["Authorization"] = f"Api-Key {self.api_key}"
         elif self.username and self.password:
-            auth = httpx.BasicAuth(self.username, self.password)
+            token = base64.b64encode(f"{self.username}:{self.password}".encode()).decode()
+            headers["Authorization"] = f"Basic {token}"
 
         self._client = httpx.AsyncClient(
+            base_url=self.BASE_URL + "/",
             timeout=self.timeout,
             headers=headers,
-            auth=auth,
         )
         return self
 
@@ -155,94 +254,262 @@ class PeeringDBClient:
 
         params = params or {}
 
-        # Build cache key
-        cache_key = f"peeringdb:{endpoint}:{urlencode(sorted(params.items()))}"
+        cache_key = self._cache_key(endpoint, params)
 
-        # Check cache
+        # Check cache: the in-process copy first, which saves an await (and a
+        # file read for FileCache) on repeat lookups, then the backing cache.
+        # An expired backing entry is kept as ``stale`` so the fetch can
+        # revalidate it with a conditional GET.
+        stale: dict[str, Any] | None = None
         if use_cache and self.cache:
-            cached = await self.cache.get(cache_key)
+            cached = self._memo_get(cache_key)
+            if cached is _NOT_FOUND:
+                raise self._not_found(endpoint)
             if cached is not None:
                 return cached
+            entry = await self.cache.get(cache_key)
+            if entry is not None:
+                remaining = entry.get("expires_at", 0) - time.time()
+                if entry.get("not_found"):
+                    if remaining > 0:
+                        self._memo_set(cache_key, _NOT_FOUND, remaining)
+                        raise self._not_found(endpoint)
+                elif remaining > 0:
+                    self._memo_set(cache_key, entry["data"], remaining)
+                    return entry["data"]
+                else:
+                    stale = entry
+
+        logger.debug("PeeringDB cache miss: %s %s -> %s", endpoint, params, cache_key)
 
         if self.offline:
+            if stale is not None:
+                return stale["data"]
             raise OfflineCacheMiss(
                 f"offline mode: no cached response for PeeringDB endpoint "
                 f"{endpoint!r} (params={params}). Run online once to populate."
             )
 
-        # Build URL
-        url = f"{self.BASE_URL}/{endpoint}"
+        # A forced refresh must not be answered by a fetch that started
+        # before it was asked for.
+        if not use_cache:
+            return await self._fetch(endpoint, params, cache_key, stale)
+
+        # Concurrent callers asking for the same resource share one upstream
+        # request instead of each missing the cache and fetching it again.
+        # The shared fetch outlives a cancelled caller, so its outcome is
+        # collected here even when nobody is left awaiting it.
+        pending = self._inflight.get(cache_key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._fetch(endpoint, params, cache_key, stale))
+            self._inflight[cache_key] = pending
+
+            def _settle(task: asyncio.Future[dict[str, Any]]) -> None:
+                if self._inflight.get(cache_key) is task:
+                    del self._inflight[cache_key]
+                if not task.cancelled():
+                    task.exception()
+
+            pending.add_done_callback(_settle)
+        return await asyncio.shield(pending)
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str,
+        stale: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Fetch an endpoint from the API with retries and cache the result.
+
+        If ``stale`` (an expired cache entry) carries an ETag or
+        Last-Modified validator, the GET is made conditional; a 304 reply
+        renews the stale entry without transferring or decoding a body.
+        """
+        headers: dict[str, str] = {}
+        if stale is not None:
+            if stale.get("etag"):
+                headers["If-None-Match"] = stale["etag"]
+            if stale.get("last_modified"):
+                headers["If-Modified-Since"] = stale["last_modified"]
 
         # Make request with retries. 429 (rate limit) and 5xx are retried with
         # exponential backoff + jitter; Retry-After is honored when present.
         last_error: Exception | None = None
         for attempt in range(self.max_retries):
             try:
-                response = await self._client.get(url, params=params)
-
-                if response.status_code == 401:
-                    raise PeeringDBAuthError("Authentication failed")
-                if response.status_code == 403:
-                    raise PeeringDBAuthError("Access denied")
-                if response.status_code == 404:
-                    raise PeeringDBNotFoundError(f"Resource not found: {endpoint}")
-                if response.status_code == 429:
-                    last_error = PeeringDBRateLimitError("Rate limit exceeded")
-                    if attempt < self.max_retries - 1:
-                        await asyncio.sleep(
-                            self._retry_delay(attempt, response.headers.get("Retry-After"))
-                        )
-                        continue
-                    raise last_error
-
-                response.raise_for_status()
-                data = response.json()
+                response = await self._client.get(endpoint, params=params, headers=headers)
+
+                if response.status_code == 304 and stale is not None:
+                    data = stale["data"]
+                    etag, last_modified = stale.get("etag"), stale.get("last_modified")
+                elif not response.is_success:
+                    if response.status_code == 404 and self.cache:
+                        await self._store_not_found(cache_key)
+                    error = self._STATUS_ERRORS.get(response.status_code)
+                    if error is not None:
+                        exc_type, message = error
+                        raise exc_type(message.format(endpoint=endpoint))
+                    if response.status_code == 429:
+                        last_error = PeeringDBRateLimitError("Rate limit exceeded")
+                        if attempt < self.max_retries - 1:
+                            await asyncio.sleep(self._retry_delay(
+                                attempt,
+                                response.headers.get("Retry-After"),
+                                self.backoff_factor,
+                            ))
+                            continue
+                        raise last_error
+                    response.raise_for_status()
+                else:
+                    data = orjson.loads(response.content) if orjson else response.json()
+                    etag = response.headers.get("ETag")
+                    last_modified = response.headers.get("Last-Modified")
 
                 # Cache successful response
                 if self.cache:
-                    await self.cache.set(cache_key, data, ttl=self.cache_ttl)
+                    await self._store(cache_key, endpoint, data, etag, last_modified)
 
                 return data
 
             except httpx.HTTPStatusError as e:
                 last_error = e
-                if e.response.status_code in (401, 403, 404):
-                    raise
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self._retry_delay(attempt))
+                    await asyncio.sleep(self._retry_delay(
+                        attempt,
+                        e.response.headers.get("Retry-After"),
+                        self.backoff_factor,
+                    ))
 
             except httpx.RequestError as e:
                 last_error = e
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self._retry_delay(attempt))
+                    await asyncio.sleep(
+                        self._retry_delay(attempt, backoff_factor=self.backoff_factor)
+                    )
 
         raise PeeringDBError(f"Request failed after {self.max_retries} attempts: {last_error}")
 
     @staticmethod
-    def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
+    def _cache_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Build a fixed-length cache key for an endpoint + query.
+
+        The endpoint stays readable; the query (which may carry long
+        ``name__contains`` or ``asn__in`` values) is reduced to a 128-bit
+        blake2b digest of its sorted, urlencoded form. Encoding keeps a
+        value containing ``&`` or ``=`` from colliding with another query.
+        """
+        query = urlencode(sorted(params.items()))
+        digest = hashlib.blake2b(query.encode(), digest_size=16).hexdigest()
+        return f"peeringdb:{endpoint}:{digest}"
+
+    async def _store(
+        self,
+        cache_key: str,
+        endpoint: str,
+        data: dict[str, Any],
+        etag: str | None,
+        last_modified: str | None,
+    ) -> None:
+        """Cache a response along with its revalidation headers.
+
+        The entry is fresh for the endpoint's TTL. When the server sent a
+        validator, the backing cache keeps it ``REVALIDATE_WINDOW`` longer so
+        an expired entry can still be revalidated instead of refetched.
+        """
+        ttl = self._ttl_for(endpoint)
+        self._memo_set(cache_key, data, ttl)
+        entry = {
+            "data": data,
+            "etag": etag,
+            "last_modified": last_modified,
+            "expires_at": time.time() + ttl,
+        }
+        if etag or last_modified:
+            ttl += self.REVALIDATE_WINDOW
+        await self.cache.set(cache_key, entry, ttl=ttl)
+
+    async def _store_not_found(self, cache_key: str) -> None:
+        """Remember a 404 for ``NOT_FOUND_TTL`` seconds."""
+        ttl = min(self.cache_ttl, self.NOT_FOUND_TTL)
+        self._memo_set(cache_key, _NOT_FOUND, ttl)
+        entry = {"not_found": True, "expires_at": time.time() + ttl}
+        await self.cache.set(cache_key, entry, ttl=ttl)
+
+    def _not_found(self, endpoint: str) -> PeeringDBNotFoundError:
+        exc_type, message = self._STATUS_ERRORS[404]
+        return exc_type(message.format(endpoint=endpoint))
+
+    def _memo_get(self, cache_key: str) -> dict[str, Any] | None:
+        entry = self._memo.get(cache_key)
+        if entry is None:
+            return None
+        expires_at, data = entry
+        if expires_at <= time.monotonic():
+            del self._memo[cache_key]
+            return None
+        self._memo.move_to_end(cache_key)
+        return data
+
+    def _memo_set(self, cache_key: str, data: dict[str, Any], ttl: float) -> None:
+        self._memo[cache_key] = (time.monotonic() + ttl, data)
+        self._memo.move_to_end(cache_key)
+        if len(self._memo) > self.MEMO_MAX_ENTRIES:
+            self._memo.popitem(last=False)
+
+    def _ttl_for(self, endpoint: str) -> int:
+        """Cache TTL for an endpoint such as 'net' or 'ix/26'."""
+        return self.cache_ttl_overrides.get(endpoint.split("/", 1)[0], self.cache_ttl)
+
+    @staticmethod
+    def _retry_delay(
+        attempt: int,
+        retry_after: str | None = None,
+        backoff_factor: float = 1.0,
+    ) -> float:
         """Compute retry delay in seconds.
 
         Honors a numeric Retry-After header if present (PeeringDB sends one
-        on 429s). Otherwise: exponential backoff (2^attempt) capped at 30s,
-        plus 0–500 ms of jitter to avoid thundering-herd when many callers
-        retry simultaneously.
+        on 429s and 503s). Otherwise: exponential backoff
+        (backoff_factor * 2^attempt) capped at 30s, plus 0–500 ms of jitter
+        to avoid thundering-herd when many callers retry simultaneously.
         """
+        base = backoff_factor * 2 ** attempt
         if retry_after is not None:
             try:
                 base = float(retry_after)
             except ValueError:
-                base = 2 ** attempt
-        else:
-            base = 2 ** attempt
+                pass
         return min(base, 30.0) + random.uniform(0, 0.5)
 
+    async def _request_in(
+        self,
+        endpoint: str,
+        field: str,
+        values: Iterable[int],
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all records whose ``field`` is in ``values``.
+
+        Uses PeeringDB's ``<field>__in=a,b,c`` filter, split into batches of
+        ``IN_QUERY_BATCH_SIZE`` that are requested concurrently.
+        """
+        values = sorted(set(values))
+        size = self.IN_QUERY_BATCH_SIZE
+        results = await asyncio.gather(*(
+            self._request(endpoint, {f"{field}__in": ",".join(map(str, values[i:i + size]))})
+            for i in range(0, len(values), size)
+        ))
+        return [row for r in results for row in self._extract_data(r)]
+
     def _extract_data(self, response: dict[str, Any]) -> list[dict[str, Any]]:
         """Extract data array from response."""
         return response.get("data", [])
 
-    def _extract_single(self, response: dict[str, Any]) -> dict[str, Any] | None:
+    @staticmethod
+    def _extract_single(response: dict[str, Any]) -> dict[str, Any] | None:
         """Extract single item from response."""
-        data = self._extract_data(response)
+        data = response.get("data")
         return data[0] if data else None
 
     # ========================================================================
@@ -281,6 +548,19 @@ class PeeringDBClient:
             raise PeeringDBNotFoundError(f"ASN {asn} not found in PeeringDB")
         return Network(**item)
 
+    async def get_networks_by_asns(self, asns: Iterable[int]) -> dict[int, Network]:
+        """
+        Get networks for many ASNs with batched ``asn__in`` queries.
+
+        Args:
+            asns: AS numbers
+
+        Returns:
+            Dict of ASN to Network; ASNs not in PeeringDB are absent
+        """
+        rows = await self._request_in("net", "asn", asns)
+        return {n.asn: n for n in (Network(**row) for row in rows)}
+
     async def search_networks(
         self,
         name: str | None = None,
@@ -316,7 +596,7 @@ class PeeringDBClient:
             params["policy_general"] = policy_general
 
         data = await self._request("net", params)
-        return [Network(**n) for n in self._extract_data(data)]
+        return NetworkList.from_api(data).data
 
     async def get_network_ixlans(self, asn: int) -> list[NetworkIXLan]:
         """
@@ -328,7 +608,9 @@ class PeeringDBClient:
         Returns:
             List of IX connections
         """
-        data = await self._request("netixlan", {"asn": asn})
+        data = await self._request(
+            "netixlan", {"asn": asn, "fields": ",".join(self.NETIXLAN_FIELDS)}
+        )
         return [NetworkIXLan(**n) for n in self._extract_data(data)]
 
     async def get_network_facilities(self, asn: int) -> list[NetworkFacility]:
@@ -341,9 +623,11 @@ class PeeringDBClient:
         Returns:
             List of facility connections
         """
-        # First get net_id from ASN
-        network = await self.get_network_by_asn(asn)
-        data = await self._request("netfac", {"net_id": network.id})
+        # netfac rows carry the network's ASN as local_asn, so filter on it
+        # directly instead of resolving net_id with a separate net lookup.
+        data = await self._request(
+            "netfac", {"local_asn": asn, "fields": ",".join(self.NETFAC_FIELDS)}
+        )
         return [NetworkFacility(**n) for n in self._extract_data(data)]
 
     # ========================================================================
@@ -366,6 +650,19 @@ class PeeringDBClient:
             raise PeeringDBNotFoundError(f"IX {ix_id} not found")
         return InternetExchange(**item)
 
+    async def get_ixes_by_ids(self, ix_ids: Iterable[int]) -> dict[int, InternetExchange]:
+        """
+        Get many Internet Exchanges with batched ``id__in`` queries.
+
+        Args:
+            ix_ids: PeeringDB IX IDs
+
+        Returns:
+            Dict of IX ID to InternetExchange; unknown IDs are absent
+        """
+        rows = await self._request_in("ix", "id", ix_ids)
+        return {ix.id: ix for ix in (InternetExchange(**row) for row in rows)}
+
     async def search_ixes(
         self,
         name: str | None = None,
@@ -399,7 +696,7 @@ class PeeringDBClient:
             params["region_continent"] = region
 
         data = await self._request("ix", params)
-        return [InternetExchange(**ix) for ix in self._extract_data(data)]
+        return IXList.from_api(data).data
 
     async def get_ix_members(self, ix_id: int) -> list[NetworkIXLan]:
         """
@@ -411,7 +708,9 @@ class PeeringDBClient:
         Returns:
             List of network connections at this IX
         """
-        data = await self._request("netixlan", {"ix_id": ix_id})
+        data = await self._request(
+            "netixlan", {"ix_id": ix_id, "fields": ",".join(self.NETIXLAN_FIELDS)}
+        )
         return [NetworkIXLan(**n) for n in self._extract_data(data)]
 
     async def get_ix_prefixes(self, ix_id: int) -> list[IXLanPrefix]:
@@ -428,12 +727,10 @@ class PeeringDBClient:
         data = await self._request("ixlan", {"ix_id": ix_id})
         ixlans = self._extract_data(data)
 
-        prefixes = []
-        for ixlan in ixlans:
-            prefix_data = await self._request("ixpfx", {"ixlan_id": ixlan["id"]})
-            prefixes.extend([IXLanPrefix(**p) for p in self._extract_data(prefix_data)])
-
-        return prefixes
+        results = await asyncio.gather(*(
+            self._request("ixpfx", {"ixlan_id": ixlan["id"]}) for ixlan in ixlans
+        ))
+        return [IXLanPrefix(**p) for r in results for p in self._extract_data(r)]
 
     # ========================================================================
     # Facility Endpoints
@@ -455,6 +752,19 @@ class PeeringDBClient:
             raise PeeringDBNotFoundError(f"Facility {fac_id} not found")
         return Facility(**item)
 
+    async def get_facilities_by_ids(self, fac_ids: Iterable[int]) -> dict[int, Facility]:
+        """
+        Get many facilities with batched ``id__in`` queries.
+
+        Args:
+            fac_ids: PeeringDB facility IDs
+
+        Returns:
+            Dict of facility ID to Facility; unknown IDs are absent
+        """
+        rows = await self._request_in("fac", "id", fac_ids)
+        return {f.id: f for f in (Facility(**row) for row in rows)}
+
     async def search_facilities(
         self,
         name: str | None = None,
@@ -484,7 +794,7 @@ class PeeringDBClient:
             params["city__contains"] = city
 
         data = await self._request("fac", params)
-        return [Facility(**f) for f in self._extract_data(data)]
+        return FacilityList.from_api(data).data
 
     async def get_facility_networks(self, fac_id: int) -> list[NetworkFacility]:
         """
@@ -496,7 +806,9 @@ class PeeringDBClient:
         Returns:
             List of networks at this facility
         """
-        data = await self._request("netfac", {"fac_id": fac_id})
+        data = await self._request(
+            "netfac", {"fac_id": fac_id, "fields": ",".join(self.NETFAC_FIELDS)}
+        )
         return [NetworkFacility(**n) for n in self._extract_data(data)]
 
     # ========================================================================
@@ -533,29 +845,18 @@ class PeeringDBClient:
         Returns:
             NetworkPresence with all IX and facility data
         """
-        network = await self.get_network_by_asn(asn)
-        connections = await self.get_network_ixlans(asn)
-        net_facilities = await self.get_network_facilities(asn)
+        network, connections, net_facilities = await asyncio.gather(
+            self.get_network_by_asn(asn),
+            self.get_network_ixlans(asn),
+            self.get_network_facilities(asn),
+        )
 
-        # Get IX details
-        ix_ids = set(c.ix_id for c in connections)
-        exchanges = []
-        for ix_id in ix_ids:
-            try:
-                ix = await self.get_ix(ix_id)
-                exchanges.append(ix)
-            except PeeringDBNotFoundError:
-                continue
-
-        # Get facility details
-        fac_ids = set(nf.fac_id for nf in net_facilities)
-        facilities = []
-        for fac_id in fac_ids:
-            try:
-                fac = await self.get_facility(fac_id)
-                facilities.append(fac)
-            except PeeringDBNotFoundError:
-                continue
+        ixes_by_id, facs_by_id = await asyncio.gather(
+            self.get_ixes_by_ids(c.ix_id for c in connections),
+            self.get_facilities_by_ids(nf.fac_id for nf in net_facilities),
+        )
+        exchanges = list(ixes_by_id.values())
+        facilities = list(facs_by_id.values())
 
         return NetworkPresence(
             asn=asn,
@@ -578,28 +879,26 @@ class PeeringDBClient:
         Returns:
             List of common IXes with connection details
         """
-        conn1 = await self.get_network_ixlans(asn1)
-        conn2 = await self.get_network_ixlans(asn2)
+        conn1, conn2 = await asyncio.gather(
+            self.get_network_ixlans(asn1),
+            self.get_network_ixlans(asn2),
+        )
 
         # Index by IX ID
         ix_map1 = {c.ix_id: c for c in conn1}
         ix_map2 = {c.ix_id: c for c in conn2}
 
-        common_ix_ids = set(ix_map1.keys()) & set(ix_map2.keys())
+        common_ix_ids = ix_map1.keys() & ix_map2.keys()
+        ix_by_id = await self.get_ixes_by_ids(common_ix_ids)
 
-        common = []
-        for ix_id in common_ix_ids:
-            try:
-                ix = await self.get_ix(ix_id)
-                common.append(CommonIX(
-                    ix=ix,
-                    net1_connection=ix_map1[ix_id],
-                    net2_connection=ix_map2[ix_id],
-                ))
-            except PeeringDBNotFoundError:
-                continue
-
-        return common
+        return [
+            CommonIX(
+                ix=ix,
+                net1_connection=ix_map1[ix_id],
+                net2_connection=ix_map2[ix_id],
+            )
+            for ix_id, ix in ix_by_id.items()
+        ]
 
     async def find_common_facilities(self, asn1: int, asn2: int) -> list[Facility]:
         """
@@ -612,23 +911,18 @@ class PeeringDBClient:
         Returns:
             List of common facilities
         """
-        fac1 = await self.get_network_facilities(asn1)
-        fac2 = await self.get_network_facilities(asn2)
-
-        fac_ids1 = set(f.fac_id for f in fac1)
-        fac_ids2 = set(f.fac_id for f in fac2)
+        fac1, fac2 = await asyncio.gather(
+            self.get_network_facilities(asn1),
+            self.get_network_facilities(asn2),
+        )
 
-        common_fac_ids = fac_ids1 & fac_ids2
+        fac_map1 = {f.fac_id: f for f in fac1}
+        fac_map2 = {f.fac_id: f for f in fac2}
 
-        facilities = []
-        for fac_id in common_fac_ids:
-            try:
-                fac = await self.get_facility(fac_id)
-                facilities.append(fac)
-            except PeeringDBNotFoundError:
-                continue
+        common_fac_ids = fac_map1.keys() & fac_map2.keys()
+        facs_by_id = await self.get_facilities_by_ids(common_fac_ids)
 
-        return facilities
+        return list(facs_by_id.values())
 
     async def find_peering_opportunities(
         self,
@@ -671,19 +965,8 @@ class PeeringDBClient:
             List of networks with open peering
         """
         members = await self.get_ix_members(ix_id)
-        asns = set(m.asn for m in members)
-
-        open_networks = []
-        for asn in asns:
-            try:
-                network = await self.get_network_by_asn(asn)
-                if network.is_open_peering:
-                    open_networks.append(network)
-            except PeeringDBNotFoundError:
-                continue
-            await asyncio.sleep(0.05)  # Rate limit
-
-        return open_networks
+        networks = await self.get_networks_by_asns(m.asn for m in members)
+        return [n for n in networks.values() if n.is_open_peering]
 
     # ========================================================================
     # Convenience Methods
@@ -704,8 +987,10 @@ class PeeringDBClient:
         except PeeringDBNotFoundError:
             return {"asn": asn, "in_peeringdb": False}
 
-        connections = await self.get_network_ixlans(asn)
-        facilities = await self.get_network_facilities(asn)
+        connections, facilities = await asyncio.gather(
+            self.get_network_ixlans(asn),
+            self.get_network_facilities(asn),
+        )
 
         return {
             "asn": asn,
@@ -730,7 +1015,11 @@ class PeeringDBClientSync:
     """
     Synchronous wrapper around PeeringDBClient.
 
-    Useful for CLI and simple scripts.
+    Useful for CLI and simple scripts. A single PeeringDBClient (and its
+    connection pool) is kept open on a background event loop and reused by
+    every call, so N sync calls pay for one TCP+TLS handshake rather than N.
+    Call ``close()`` (or use as a context manager) to release it early;
+    otherwise it is closed at interpreter exit.
 
     Example:
         client = PeeringDBClientSync()
@@ -739,59 +1028,64 @@ class PeeringDBClientSync:
 
     def __init__(self, **kwargs):
         self._kwargs = kwargs
+        self._loop = BackgroundLoop()
+        self._client: PeeringDBClient | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "PeeringDBClientSync":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get_client(self) -> PeeringDBClient:
+        with self._lock:
+            if self._client is None:
+                self._client = self._loop.run(PeeringDBClient(**self._kwargs).__aenter__())
+                atexit.register(self.close)
+            return self._client
+
+    def _run(self, method: str, *args, **kwargs):
+        client = self._get_client()
+        return self._loop.run(getattr(client, method)(*args, **kwargs))
+
+    def close(self) -> None:
+        """Close the shared client and stop the background loop."""
+        with self._lock:
+            client, self._client = self._client, None
+            if client is not None:
+                self._loop.run(client.__aexit__(None, None, None))
+                atexit.unregister(self.close)
+            self._loop.close()
 
     def get_network_by_asn(self, asn: int) -> Network:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.get_network_by_asn(asn)
-        return asyncio.run(_inner())
+        return self._run("get_network_by_asn", asn)
 
     def get_network_ixlans(self, asn: int) -> list[NetworkIXLan]:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.get_network_ixlans(asn)
-        return asyncio.run(_inner())
+        return self._run("get_network_ixlans", asn)
 
     def get_network_facilities(self, asn: int) -> list[NetworkFacility]:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.get_network_facilities(asn)
-        return asyncio.run(_inner())
+        return self._run("get_network_facilities", asn)
 
     def get_network_presence(self, asn: int) -> NetworkPresence:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.get_network_presence(asn)
-        return asyncio.run(_inner())
+        return self._run("get_network_presence", asn)
 
     def find_common_ixes(self, asn1: int, asn2: int) -> list[CommonIX]:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.find_common_ixes(asn1, asn2)
-        return asyncio.run(_inner())
+        return self._run("find_common_ixes", asn1, asn2)
 
     def find_peering_opportunities(
         self,
         asn1: int,
         asn2: int,
     ) -> PeeringOpportunity:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.find_peering_opportunities(asn1, asn2)
-        return asyncio.run(_inner())
+        return self._run("find_peering_opportunities", asn1, asn2)
 
     def get_asn_summary(self, asn: int) -> dict[str, Any]:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.get_asn_summary(asn)
-        return asyncio.run(_inner())
+        return self._run("get_asn_summary", asn)
 
     def search_ixes(
         self,
         name: str | None = None,
         country: str | None = None,
     ) -> list[InternetExchange]:
-        async def _inner():
-            async with PeeringDBClient(**self._kwargs) as client:
-                return await client.search_ixes(name=name, country=country)
-        return asyncio.run(_inner())
+        return self._run("search_ixes", name=name, country=country)
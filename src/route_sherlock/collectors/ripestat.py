@@ -12,13 +12,23 @@ Usage:
 from __future__ import annotations
 
 import asyncio
+import atexit
+import functools
 import random
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import UTC, datetime, timedelta
+from email.utils import parsedate_to_datetime
 from typing import Any
 from urllib.parse import urlencode
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # optional: pip install 'route-sherlock[fast]'
+    orjson = None
+
 from route_sherlock.models.ripestat import (
     AnnouncedPrefixes,
     ASNeighbours,
@@ -27,12 +37,12 @@ from route_sherlock.models.ripestat import (
     BGPUpdateActivity,
     BGPUpdates,
     LookingGlass,
-    RIPEstatResponse,
     RoutingHistory,
     RoutingStatus,
     RPKIValidation,
 )
 from route_sherlock.cache.store import Cache, OfflineCacheMiss
+from route_sherlock.collectors.loop import BackgroundLoop
 
 
 class RIPEstatError(Exception):
@@ -45,6 +55,57 @@ class RIPEstatRateLimitError(RIPEstatError):
     pass
 
 
+@functools.lru_cache(maxsize=4096)
+def _normalize_resource(resource: str) -> str:
+    resource = resource.strip().upper()
+    # Ensure ASN has 'AS' prefix
+    if resource.isdigit():
+        resource = f"AS{resource}"
+    return resource
+
+
+class _RateLimiter:
+    """Token bucket admitting ``rate`` requests per second (bursts of ``rate``).
+
+    Each caller reserves the next free slot under a thread lock and then
+    sleeps until it, so one limiter can be shared by every client in the
+    process, whichever event loop or thread they run on. ``pause`` holds
+    all callers back, e.g. for a server's Retry-After.
+    """
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self._interval = 1 / rate
+        self._burst = (rate - 1) / rate
+        self._next_slot = 0.0
+        self._paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Claim the next slot; return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._paused_until, self._next_slot - self._burst)
+            self._next_slot = max(self._next_slot, start) + self._interval
+            return start - now
+
+    async def acquire(self) -> None:
+        while (delay := self._reserve()) > 0:
+            await asyncio.sleep(delay)
+            if time.monotonic() >= self._paused_until:
+                return
+
+    def pause(self, seconds: float) -> None:
+        with self._lock:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+
+
+@functools.lru_cache(maxsize=None)
+def _shared_limiter(rate: float) -> _RateLimiter:
+    """The process-wide limiter for ``rate``, shared by all RIPEstatClients."""
+    return _RateLimiter(rate)
+
+
 class RIPEstatClient:
     """
     Async client for RIPEstat Data API.
@@ -65,45 +126,121 @@ class RIPEstatClient:
     """
     
     BASE_URL = "https://stat.ripe.net/data"
+
+    # Connection pool sizing. Fan-out calls such as check_rpki_status keep
+    # many requests in flight; idle connections are kept warm for reuse.
+    # Over HTTP/2 those requests multiplex onto a single connection.
+    POOL_LIMITS = httpx.Limits(
+        max_keepalive_connections=20,
+        max_connections=100,
+        keepalive_expiry=30.0,
+    )
+
+    # Maximum concurrent validations in check_rpki_status.
+    RPKI_CONCURRENCY = 10
+
+    # RPKI validation statuses and the check_rpki_status buckets they
+    # land in; any other status is not counted.
+    _RPKI_STATUS_KEYS: dict[str, str] = {
+        "valid": "valid",
+        "invalid": "invalid",
+        "not-found": "not_found",
+    }
+
+    # Requests per second admitted across all endpoints and all clients in
+    # the process; clients share one limiter per rate.
+    RATE_LIMIT = 15
+
+    # Per-endpoint cache TTLs (seconds) for live-state queries, sized to how
+    # quickly each changes. Applied only when the caller leaves ``cache_ttl``
+    # unset: an explicit ``cache_ttl`` (a --cache-ttl 0 bypass or a week-long
+    # research pin) covers every endpoint. Anything not listed uses
+    # ``cache_ttl``. Time-bounded queries are cached without expiry regardless.
+    DEFAULT_TTLS: dict[str, int] = {
+        "as-overview": 7 * 86400,
+        "routing-status": 3600,
+        "rpki-validation": 3600,
+        "looking-glass": 600,
+    }
+
+    # How long a failed request is remembered, so callers retrying a flaky
+    # endpoint in a loop do not each run the full retry/backoff cycle.
+    # Capped at ``cache_ttl``.
+    NEGATIVE_TTL = 30
+
+    # Live-state TTL when the caller does not pass ``cache_ttl``. 24h; was
+    # 1h, too aggressive for research / batch runs and demos.
+    DEFAULT_CACHE_TTL = 86400
     
     def __init__(
         self,
         cache: Cache | None = None,
-        cache_ttl: int = 86400,  # 24h default; was 1h, too aggressive for
-                                 # research / batch runs and demos
+        cache_ttl: int | None = None,
+        cache_ttl_overrides: dict[str, int] | None = None,
         timeout: float = 30.0,
         max_retries: int = 3,
         offline: bool = False,
+        http_client: httpx.AsyncClient | None = None,
     ):
         """
         Initialize RIPEstat client.
 
         Args:
             cache: Optional cache instance for response caching
-            cache_ttl: Cache time-to-live in seconds
+            cache_ttl: Cache time-to-live in seconds for every live-state
+                endpoint. Defaults to ``DEFAULT_CACHE_TTL`` with the
+                per-endpoint ``DEFAULT_TTLS`` applied on top.
+            cache_ttl_overrides: Per-endpoint TTLs (e.g.
+                ``{"routing-status": 600}``). These apply whether or not
+                ``cache_ttl`` is given.
             timeout: Request timeout in seconds
             max_retries: Maximum retry attempts for failed requests
             offline: If True, only serve from cache; raise
                 ``OfflineCacheMiss`` on cache miss instead of making a
                 network request.
+            http_client: Optional application-wide ``httpx.AsyncClient`` to
+                send requests through. It is used as-is and left open on
+                exit, so one connection pool can be shared by many
+                ``RIPEstatClient`` contexts.
         """
         self.cache = cache
-        self.cache_ttl = cache_ttl
+        if cache_ttl is None:
+            self.cache_ttl = self.DEFAULT_CACHE_TTL
+            self.cache_ttl_overrides = {**self.DEFAULT_TTLS, **(cache_ttl_overrides or {})}
+        else:
+            self.cache_ttl = cache_ttl
+            self.cache_ttl_overrides = dict(cache_ttl_overrides or {})
         self.timeout = timeout
         self.max_retries = max_retries
         self.offline = offline
+        self._shared_client = http_client
         self._client: httpx.AsyncClient | None = None
+        self._limiter = _shared_limiter(self.RATE_LIMIT)
     
     async def __aenter__(self) -> "RIPEstatClient":
-        self._client = httpx.AsyncClient(
-            timeout=self.timeout,
-            headers={"Accept": "application/json"},
-        )
+        if self._shared_client is not None:
+            self._client = self._shared_client
+        else:
+            self._client = self.build_http_client(self.timeout)
         return self
     
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
-        if self._client:
+        if self._client and self._client is not self._shared_client:
             await self._client.aclose()
+
+    @classmethod
+    def build_http_client(cls, timeout: float = 30.0) -> httpx.AsyncClient:
+        """Create an ``httpx.AsyncClient`` configured for RIPEstat.
+
+        Suitable for passing as ``http_client`` to share one pool across
+        several ``RIPEstatClient`` instances; the caller owns its lifetime.
+        """
+        return httpx.AsyncClient(
+            timeout=timeout,
+            headers={"Accept": "application/json"},
+            limits=cls.POOL_LIMITS,
+            http2=True,
+        )
     
     # ========================================================================
     # Core Request Methods
@@ -129,8 +266,7 @@ class RIPEstatClient:
         if not self._client:
             raise RIPEstatError("Client not initialized. Use 'async with' context manager.")
         
-        # Build cache key
-        cache_key = f"ripestat:{endpoint}:{urlencode(sorted(params.items()))}"
+        cache_key = self._cache_key(endpoint, params)
         
         # Check cache
         if use_cache and self.cache:
@@ -144,7 +280,33 @@ class RIPEstatClient:
                 f"{endpoint!r} (params={params}). Run online once to populate."
             )
 
-        # Build URL
+        if not self.cache:
+            return await self._fetch(endpoint, params, cache_key)
+
+        negative_key = f"{cache_key}:neg"
+        negative_ttl = min(self.NEGATIVE_TTL, self.cache_ttl)
+        if use_cache and negative_ttl > 0:
+            failure = await self.cache.get(negative_key)
+            if failure is not None:
+                raise RIPEstatError(failure)
+        try:
+            return await self._fetch(endpoint, params, cache_key)
+        except RIPEstatRateLimitError:
+            # The limiter is already paused; replaying this as a plain
+            # RIPEstatError would hide it from callers handling rate limits.
+            raise
+        except RIPEstatError as e:
+            if use_cache and negative_ttl > 0:
+                await self.cache.set(negative_key, str(e), ttl=negative_ttl)
+            raise
+
+    async def _fetch(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str,
+    ) -> dict[str, Any]:
+        """Fetch an endpoint from the API with retries and cache the result."""
         url = f"{self.BASE_URL}/{endpoint}/data.json"
 
         # Make request with retries. 429s now retry with exponential backoff +
@@ -154,41 +316,49 @@ class RIPEstatClient:
         last_error: Exception | None = None
         for attempt in range(self.max_retries):
             try:
+                await self._limiter.acquire()
                 response = await self._client.get(url, params=params)
 
                 if response.status_code == 429:
                     last_error = RIPEstatRateLimitError("Rate limit exceeded")
                     if attempt < self.max_retries - 1:
-                        await asyncio.sleep(
+                        # Hold back every RIPEstat request, not just this
+                        # retry, until the server's window has passed.
+                        self._limiter.pause(
                             self._retry_delay(attempt, response.headers.get("Retry-After"))
                         )
                         continue
                     raise last_error
 
                 response.raise_for_status()
-                data = response.json()
+                data = orjson.loads(response.content) if orjson else response.json()
 
-                # Validate response
-                wrapped = RIPEstatResponse(**data)
-                if not wrapped.is_success:
-                    raise RIPEstatError(f"API error: {wrapped.data_call_status}")
+                # Check the envelope by hand (same rule as
+                # RIPEstatResponse.is_success); only its payload is kept.
+                if not (data.get("status") == "ok" or data.get("status_code", 200) == 200):
+                    raise RIPEstatError(f"API error: {data.get('data_call_status', '')}")
+                payload = data.get("data") or {}
 
                 # Cache successful response. Time-bounded queries (those
                 # with explicit starttime AND endtime — bgp-updates,
                 # routing-history) describe frozen historical data that
                 # cannot change, so cache them with no expiry. Live-state
-                # queries get the configured TTL.
+                # queries get their endpoint's TTL.
                 if self.cache:
                     is_time_bounded = "starttime" in params and "endtime" in params
-                    effective_ttl = None if is_time_bounded else self.cache_ttl
-                    await self.cache.set(cache_key, wrapped.data, ttl=effective_ttl)
+                    effective_ttl = None if is_time_bounded else self._ttl_for(endpoint)
+                    # A zero TTL means "bypass", not "no expiry".
+                    if effective_ttl is None or effective_ttl > 0:
+                        await self.cache.set(cache_key, payload, ttl=effective_ttl)
 
-                return wrapped.data
+                return payload
 
             except httpx.HTTPStatusError as e:
                 last_error = e
                 if attempt < self.max_retries - 1:
-                    await asyncio.sleep(self._retry_delay(attempt))
+                    await asyncio.sleep(
+                        self._retry_delay(attempt, e.response.headers.get("Retry-After"))
+                    )
 
             except httpx.RequestError as e:
                 last_error = e
@@ -197,31 +367,76 @@ class RIPEstatClient:
 
         raise RIPEstatError(f"Request failed after {self.max_retries} attempts: {last_error}")
 
+    def _ttl_for(self, endpoint: str) -> int:
+        """Cache TTL for a live-state endpoint such as 'routing-status'."""
+        return self.cache_ttl_overrides.get(endpoint, self.cache_ttl)
+
+    @staticmethod
+    def _cache_key(endpoint: str, params: dict[str, Any]) -> str:
+        """Build a canonical cache key such as ``ripestat:as-overview:resource=AS1``.
+
+        Most calls carry a single ``resource`` parameter, so sorting is
+        skipped unless there is more than one. Values are urlencoded (``/``
+        kept for readability) so one containing ``&`` or ``=`` cannot
+        collide with a different query.
+        """
+        items = sorted(params.items()) if len(params) > 1 else params.items()
+        return f"ripestat:{endpoint}:{urlencode(list(items), safe='/')}"
+
     @staticmethod
     def _retry_delay(attempt: int, retry_after: str | None = None) -> float:
-        """Compute retry delay in seconds. Mirrors PeeringDBClient._retry_delay."""
+        """Compute retry delay in seconds.
+
+        Exponential backoff (``2 ** attempt``) unless the server sent a
+        Retry-After header, either as delta-seconds or as an HTTP-date.
+        Capped at 30 seconds, plus up to 0.5s of jitter.
+        """
+        base: float = 2 ** attempt
         if retry_after is not None:
             try:
                 base = float(retry_after)
             except ValueError:
-                base = 2 ** attempt
-        else:
-            base = 2 ** attempt
+                try:
+                    when = parsedate_to_datetime(retry_after)
+                except (TypeError, ValueError):
+                    pass
+                else:
+                    base = max(0.0, (when - datetime.now(UTC)).total_seconds())
         return min(base, 30.0) + random.uniform(0, 0.5)
     
     @staticmethod
     def _format_time(dt: datetime) -> str:
-        """Format datetime for RIPEstat API."""
-        return dt.strftime("%Y-%m-%dT%H:%M")
+        """Format datetime for RIPEstat API (``YYYY-MM-DDTHH:MM``)."""
+        return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d}T{dt.hour:02d}:{dt.minute:02d}"
+
+    @classmethod
+    def _time_params(
+        cls,
+        start_time: datetime | None,
+        end_time: datetime | None,
+        default_span: timedelta,
+    ) -> dict[str, str]:
+        """Build ``starttime``/``endtime`` params for a query window.
+
+        ``end_time`` defaults to now (UTC) and ``start_time`` to
+        ``default_span`` before it. Both are snapped to the start of the
+        hour so consecutive runs of the same logical query produce the same
+        cache key; otherwise the minute component would drift on every call
+        and time-windowed queries would never hit the cache.
+        """
+        if end_time is None:
+            end_time = datetime.now(UTC)
+        if start_time is None:
+            start_time = end_time - default_span
+        return {
+            "starttime": cls._format_time(start_time.replace(minute=0)),
+            "endtime": cls._format_time(end_time.replace(minute=0)),
+        }
     
     @staticmethod
     def _normalize_resource(resource: str) -> str:
         """Normalize ASN or prefix format."""
-        resource = resource.strip().upper()
-        # Ensure ASN has 'AS' prefix
-        if resource.isdigit():
-            resource = f"AS{resource}"
-        return resource
+        return _normalize_resource(resource)
     
     # ========================================================================
     # API Endpoints
@@ -239,7 +454,7 @@ class RIPEstatClient:
         """
         asn = self._normalize_resource(asn)
         data = await self._request("as-overview", {"resource": asn})
-        return ASOverview(**data)
+        return ASOverview.model_validate(data)
     
     async def get_routing_status(self, resource: str) -> RoutingStatus:
         """
@@ -255,7 +470,7 @@ class RIPEstatClient:
         """
         resource = self._normalize_resource(resource)
         data = await self._request("routing-status", {"resource": resource})
-        return RoutingStatus(**data)
+        return RoutingStatus.model_validate(data)
     
     async def get_routing_history(
         self,
@@ -277,24 +492,13 @@ class RIPEstatClient:
             RoutingHistory with timeline of announcements
         """
         resource = self._normalize_resource(resource)
-
-        if end_time is None:
-            end_time = datetime.utcnow()
-        if start_time is None:
-            start_time = end_time - timedelta(days=7)
-
-        # Snap to start of hour for stable cache keys (see get_bgp_updates).
-        end_time = end_time.replace(minute=0, second=0, microsecond=0)
-        start_time = start_time.replace(minute=0, second=0, microsecond=0)
-
         params = {
             "resource": resource,
-            "starttime": self._format_time(start_time),
-            "endtime": self._format_time(end_time),
+            **self._time_params(start_time, end_time, timedelta(days=7)),
         }
 
         data = await self._request("routing-history", params)
-        return RoutingHistory(**data)
+        return RoutingHistory.model_validate(data)
     
     async def get_bgp_updates(
         self,
@@ -318,29 +522,15 @@ class RIPEstatClient:
             BGPUpdates with list of update events
         """
         resource = self._normalize_resource(resource)
-
-        if end_time is None:
-            end_time = datetime.utcnow()
-        if start_time is None:
-            start_time = end_time - timedelta(hours=1)
-
-        # Snap to the start of the hour so consecutive runs of the same logical
-        # query produce the same cache key. Without this, the minute component
-        # in starttime/endtime would drift on every call and the on-disk cache
-        # would never hit for time-windowed queries.
-        end_time = end_time.replace(minute=0, second=0, microsecond=0)
-        start_time = start_time.replace(minute=0, second=0, microsecond=0)
-
         params = {
             "resource": resource,
-            "starttime": self._format_time(start_time),
-            "endtime": self._format_time(end_time),
+            **self._time_params(start_time, end_time, timedelta(hours=1)),
         }
         if rrcs:
             params["rrcs"] = ",".join(rrcs)
 
         data = await self._request("bgp-updates", params)
-        return BGPUpdates(**data)
+        return BGPUpdates.from_api(data)
 
     async def get_bgp_update_activity(
         self,
@@ -356,22 +546,12 @@ class RIPEstatClient:
         Use this when you only need totals/rates, not per-event details.
         """
         resource = self._normalize_resource(resource)
-
-        if end_time is None:
-            end_time = datetime.utcnow()
-        if start_time is None:
-            start_time = end_time - timedelta(days=1)
-
-        end_time = end_time.replace(minute=0, second=0, microsecond=0)
-        start_time = start_time.replace(minute=0, second=0, microsecond=0)
-
         params = {
             "resource": resource,
-            "starttime": self._format_time(start_time),
-            "endtime": self._format_time(end_time),
+            **self._time_params(start_time, end_time, timedelta(days=1)),
         }
         data = await self._request("bgp-update-activity", params)
-        return BGPUpdateActivity(**data)
+        return BGPUpdateActivity.model_validate(data)
 
     async def get_announced_prefixes(self, asn: str) -> AnnouncedPrefixes:
         """
@@ -385,7 +565,7 @@ class RIPEstatClient:
         """
         asn = self._normalize_resource(asn)
         data = await self._request("announced-prefixes", {"resource": asn})
-        return AnnouncedPrefixes(**data)
+        return AnnouncedPrefixes.model_validate(data)
     
     async def get_as_path_length(self, resource: str) -> ASPathLength:
         """
@@ -399,7 +579,7 @@ class RIPEstatClient:
         """
         resource = self._normalize_resource(resource)
         data = await self._request("as-path-length", {"resource": resource})
-        return ASPathLength(**data)
+        return ASPathLength.model_validate(data)
     
     async def get_rpki_validation(
         self,
@@ -428,7 +608,7 @@ class RIPEstatClient:
         }
 
         data = await self._request("rpki-validation", params)
-        return RPKIValidation(**data)
+        return RPKIValidation.model_validate(data)
     
     async def get_as_neighbours(
         self,
@@ -451,7 +631,7 @@ class RIPEstatClient:
             params["query_time"] = self._format_time(query_time)
         
         data = await self._request("asn-neighbours", params)
-        return ASNeighbours(**data)
+        return ASNeighbours.model_validate(data)
     
     async def get_looking_glass(self, resource: str) -> LookingGlass:
         """
@@ -467,7 +647,7 @@ class RIPEstatClient:
         """
         resource = self._normalize_resource(resource)
         data = await self._request("looking-glass", {"resource": resource})
-        return LookingGlass(**data)
+        return LookingGlass.model_validate(data)
     
     # ========================================================================
     # Convenience Methods
@@ -483,12 +663,7 @@ class RIPEstatClient:
         Returns:
             Dict with 'ipv4', 'ipv6', and 'total' counts
         """
-        prefixes = await self.get_announced_prefixes(asn)
-        return {
-            "ipv4": len(prefixes.ipv4_prefixes),
-            "ipv6": len(prefixes.ipv6_prefixes),
-            "total": prefixes.prefix_count,
-        }
+        return self._prefix_counts(await self.get_announced_prefixes(asn))
     
     async def get_upstream_asns(self, asn: str) -> list[int]:
         """
@@ -500,14 +675,48 @@ class RIPEstatClient:
         Returns:
             List of upstream ASNs sorted by connection count
         """
-        neighbours = await self.get_as_neighbours(asn)
-        return sorted(
-            [n.asn for n in neighbours.upstreams],
-            key=lambda a: next(
-                (n.power for n in neighbours.upstreams if n.asn == a), 0
-            ),
-            reverse=True,
+        return self._upstreams_by_power(await self.get_as_neighbours(asn))
+
+    async def get_asn_bundle(self, asn: str) -> dict[str, Any]:
+        """
+        Get overview, routing status, prefix counts and upstreams for an ASN.
+
+        The four underlying lookups are independent and issued concurrently.
+
+        Args:
+            asn: AS number
+
+        Returns:
+            Dict with 'overview' (ASOverview), 'routing_status'
+            (RoutingStatus), 'prefix_count' (as from get_prefix_count) and
+            'upstreams' (as from get_upstream_asns)
+        """
+        asn = self._normalize_resource(asn)
+        overview, status, prefixes, neighbours = await asyncio.gather(
+            self.get_as_overview(asn),
+            self.get_routing_status(asn),
+            self.get_announced_prefixes(asn),
+            self.get_as_neighbours(asn),
         )
+        return {
+            "overview": overview,
+            "routing_status": status,
+            "prefix_count": self._prefix_counts(prefixes),
+            "upstreams": self._upstreams_by_power(neighbours),
+        }
+
+    @staticmethod
+    def _prefix_counts(prefixes: AnnouncedPrefixes) -> dict[str, int]:
+        return {
+            "ipv4": len(prefixes.ipv4_prefixes),
+            "ipv6": len(prefixes.ipv6_prefixes),
+            "total": prefixes.prefix_count,
+        }
+
+    @staticmethod
+    def _upstreams_by_power(neighbours: ASNeighbours) -> list[int]:
+        upstreams = sorted(neighbours.upstreams, key=lambda n: n.power, reverse=True)
+        return [n.asn for n in upstreams]
     
     async def check_rpki_status(
         self,
@@ -544,15 +753,22 @@ class RIPEstatClient:
             "not_found": [],
         }
 
-        for prefix in sampled:
-            try:
-                validation = await self.get_rpki_validation(prefix, asn)
-                status_key = validation.status.replace("-", "_")
-                if status_key in results:
-                    results[status_key].append(prefix)
-                await asyncio.sleep(0.1)
-            except RIPEstatError:
+        semaphore = asyncio.Semaphore(self.RPKI_CONCURRENCY)
+
+        async def _validate(prefix: str) -> RPKIValidation | None:
+            async with semaphore:
+                try:
+                    return await self.get_rpki_validation(prefix, asn)
+                except RIPEstatError:
+                    return None
+
+        validations = await asyncio.gather(*(_validate(p) for p in sampled))
+        for prefix, validation in zip(sampled, validations):
+            if validation is None:
                 continue
+            status_key = self._RPKI_STATUS_KEYS.get(validation.status)
+            if status_key is not None:
+                results[status_key].append(prefix)
 
         results["total_checked"] = len(sampled)  # type: ignore[assignment]
         return results
@@ -565,60 +781,65 @@ class RIPEstatClient:
 class RIPEstatClientSync:
     """
     Synchronous wrapper around RIPEstatClient.
-    
-    Useful for CLI and simple scripts.
-    
+
+    Useful for CLI and simple scripts. Like PeeringDBClientSync, one
+    RIPEstatClient is kept open on a background event loop and reused by
+    every call. Call ``close()`` (or use as a context manager) to release
+    it early; otherwise it is closed at interpreter exit.
+
     Example:
         client = RIPEstatClientSync()
         status = client.get_routing_status("AS16509")
     """
-    
+
     def __init__(self, **kwargs):
-        self._async_client = RIPEstatClient(**kwargs)
-    
-    def _run(self, coro):
-        return asyncio.run(self._async_make_request(coro))
-    
-    async def _async_make_request(self, coro):
-        async with self._async_client as client:
-            # Re-bind the coroutine to use the initialized client
-            method_name = coro.cr_code.co_qualname.split(".")[-1]
-            method = getattr(client, method_name)
-            # This is hacky - for proper sync wrapper, see below
-            pass
-        return await coro
-    
+        self._kwargs = kwargs
+        self._loop = BackgroundLoop()
+        self._client: RIPEstatClient | None = None
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "RIPEstatClientSync":
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _get_client(self) -> RIPEstatClient:
+        with self._lock:
+            if self._client is None:
+                self._client = self._loop.run(RIPEstatClient(**self._kwargs).__aenter__())
+                atexit.register(self.close)
+            return self._client
+
+    def _run(self, method: str, *args, **kwargs):
+        client = self._get_client()
+        return self._loop.run(getattr(client, method)(*args, **kwargs))
+
+    def close(self) -> None:
+        """Close the shared client and stop the background loop."""
+        with self._lock:
+            client, self._client = self._client, None
+            if client is not None:
+                self._loop.run(client.__aexit__(None, None, None))
+                atexit.unregister(self.close)
+            self._loop.close()
+
     def get_as_overview(self, asn: str) -> ASOverview:
-        async def _inner():
-            async with RIPEstatClient() as client:
-                return await client.get_as_overview(asn)
-        return asyncio.run(_inner())
-    
+        return self._run("get_as_overview", asn)
+
     def get_routing_status(self, resource: str) -> RoutingStatus:
-        async def _inner():
-            async with RIPEstatClient() as client:
-                return await client.get_routing_status(resource)
-        return asyncio.run(_inner())
-    
+        return self._run("get_routing_status", resource)
+
     def get_routing_history(
         self,
         resource: str,
         start_time: datetime | None = None,
         end_time: datetime | None = None,
     ) -> RoutingHistory:
-        async def _inner():
-            async with RIPEstatClient() as client:
-                return await client.get_routing_history(resource, start_time, end_time)
-        return asyncio.run(_inner())
-    
+        return self._run("get_routing_history", resource, start_time, end_time)
+
     def get_announced_prefixes(self, asn: str) -> AnnouncedPrefixes:
-        async def _inner():
-            async with RIPEstatClient() as client:
-                return await client.get_announced_prefixes(asn)
-        return asyncio.run(_inner())
-    
+        return self._run("get_announced_prefixes", asn)
+
     def get_as_neighbours(self, asn: str) -> ASNeighbours:
-        async def _inner():
-            async with RIPEstatClient() as client:
-                return await client.get_as_neighbours(asn)
-        return asyncio.run(_inner())
+        return self._run("get_as_neighbours", asn)
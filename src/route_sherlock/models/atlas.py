@@ -9,7 +9,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class ProbeStatus(str, Enum):
@@ -57,14 +57,14 @@ class ProbeLocation(BaseModel):
 
 class ProbeTag(BaseModel):
     """Probe tag."""
-    name: str
-    slug: str
+    name: str = ""
+    slug: str = ""
 
 
 class ProbeStatusInfo(BaseModel):
     """Probe status info from API."""
-    id: int
-    name: str
+    id: int | None = None
+    name: str = ""
 
     class Config:
         extra = "ignore"
@@ -82,12 +82,12 @@ class Probe(BaseModel):
     prefix_v4: str | None = None
     prefix_v6: str | None = None
     is_anchor: bool = False
-    status: ProbeStatusInfo | dict | None = None
+    status: ProbeStatusInfo | None = None
     status_since: datetime | None = None
     first_connected: datetime | None = None
     last_connected: datetime | None = None
     geometry: ProbeGeometry | None = None
-    tags: list[ProbeTag | dict] = Field(default_factory=list)
+    tags: list[ProbeTag] = Field(default_factory=list)
 
     class Config:
         extra = "ignore"
@@ -95,11 +95,7 @@ class Probe(BaseModel):
     @property
     def is_connected(self) -> bool:
         """Check if probe is currently connected."""
-        if isinstance(self.status, dict):
-            return self.status.get("name") == "Connected"
-        elif isinstance(self.status, ProbeStatusInfo):
-            return self.status.name == "Connected"
-        return False
+        return self.status is not None and self.status.name == "Connected"
 
     @property
     def asn(self) -> int | None:
@@ -218,15 +214,14 @@ class TracerouteResult(BaseModel):
     @property
     def hop_count(self) -> int:
         """Return total number of hops."""
-        return len(self.hops) if self.hops else 0
+        return len(self.hops)
 
     @property
     def reached_destination(self) -> bool:
         """Check if traceroute reached destination."""
         if not self.hops or not self.dst_addr:
             return False
-        last_hop = self.hops[-1] if self.hops else None
-        return last_hop is not None and last_hop.from_addr == self.dst_addr
+        return self.hops[-1].from_addr == self.dst_addr
 
 
 class DnsAnswer(BaseModel):
@@ -304,15 +299,52 @@ class MeasurementResults(BaseModel):
 
     def get_ping_results(self) -> list[PingResult]:
         """Parse results as ping measurements."""
-        return [PingResult(**r) for r in self.results if "avg" in r or "min" in r]
+        return _PING_RESULTS.validate_python(
+            [r for r in self.results if "avg" in r or "min" in r]
+        )
 
     def get_traceroute_results(self) -> list[TracerouteResult]:
         """Parse results as traceroute measurements."""
-        return [TracerouteResult(**r) for r in self.results if "result" in r or "hops" in r]
+        return _TRACEROUTE_RESULTS.validate_python(
+            [r for r in self.results if "result" in r or "hops" in r]
+        )
 
     def get_dns_results(self) -> list[DnsResult]:
         """Parse results as DNS measurements."""
-        return [DnsResult(**r) for r in self.results if "answers" in r or "RCODE" in r]
+        return _DNS_RESULTS.validate_python(
+            [r for r in self.results if "answers" in r or "RCODE" in r]
+        )
+
+    def parse_all(
+        self,
+    ) -> tuple[list[PingResult], list[TracerouteResult], list[DnsResult]]:
+        """Parse ping, traceroute and DNS results in one pass over ``results``.
+
+        Uses the same per-type tests as the ``get_*_results`` methods, so
+        each list matches what the corresponding getter returns.
+        """
+        ping: list[dict[str, Any]] = []
+        traceroute: list[dict[str, Any]] = []
+        dns: list[dict[str, Any]] = []
+        for r in self.results:
+            if "avg" in r or "min" in r:
+                ping.append(r)
+            if "result" in r or "hops" in r:
+                traceroute.append(r)
+            if "answers" in r or "RCODE" in r:
+                dns.append(r)
+        return (
+            _PING_RESULTS.validate_python(ping),
+            _TRACEROUTE_RESULTS.validate_python(traceroute),
+            _DNS_RESULTS.validate_python(dns),
+        )
+
+
+# Validating a whole result list in one call keeps the per-item loop inside
+# pydantic-core instead of constructing each model from Python.
+_PING_RESULTS = TypeAdapter(list[PingResult])
+_TRACEROUTE_RESULTS = TypeAdapter(list[TracerouteResult])
+_DNS_RESULTS = TypeAdapter(list[DnsResult])
 
 
 class BuiltinMeasurement(BaseModel):
@@ -6,55 +6,32 @@ Pydantic models for PeeringDB network and facility data.
 from __future__ import annotations
 
 from datetime import datetime
-from enum import Enum
-from typing import Any
+from functools import cached_property
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
+_M = TypeVar("_M", bound=BaseModel)
 
-class InfoType(str, Enum):
-    """Network info type."""
-    NSP = "NSP"  # Network Service Provider
-    CONTENT = "Content"
-    CABLE = "Cable/DSL/ISP"
-    ENTERPRISE = "Enterprise"
-    EDUCATIONAL = "Educational/Research"
-    NON_PROFIT = "Non-Profit"
-    ROUTE_SERVER = "Route Server"
-    GOVERNMENT = "Government"
-    OTHER = ""
+# Shared config for the API response models. Instances are read-only
+# snapshots of upstream data; schemas are built on first use rather than
+# at import; unknown API fields are dropped.
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, defer_build=True)
 
 
-class InfoScope(str, Enum):
-    """Network scope."""
-    REGIONAL = "Regional"
-    NORTH_AMERICA = "North America"
-    ASIA_PACIFIC = "Asia Pacific"
-    EUROPE = "Europe"
-    SOUTH_AMERICA = "South America"
-    AFRICA = "Africa"
-    AUSTRALIA = "Australia"
-    MIDDLE_EAST = "Middle East"
-    GLOBAL = "Global"
-    NOT_DISCLOSED = ""
+def to_datetime(value: str | None) -> datetime | None:
+    """Parse a PeeringDB timestamp field (``created``, ``updated``, ...).
 
-
-class PolicyGeneral(str, Enum):
-    """Peering policy."""
-    OPEN = "Open"
-    SELECTIVE = "Selective"
-    RESTRICTIVE = "Restrictive"
-    NO = "No"
-
-
-class NetixlanStatus(str, Enum):
-    """Network-IX connection status."""
-    OK = "ok"
-    DELETED = "deleted"
+    Timestamps are kept as the ISO-8601 strings PeeringDB returns and only
+    parsed when a caller needs them.
+    """
+    return datetime.fromisoformat(value) if value else None
 
 
 class Organization(BaseModel):
     """PeeringDB organization."""
+    model_config = _MODEL_CONFIG
+
     id: int
     name: str
     aka: str = ""
@@ -71,13 +48,15 @@ class Organization(BaseModel):
     suite: str = ""
     latitude: float | None = None
     longitude: float | None = None
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 class Network(BaseModel):
     """PeeringDB network (ASN) record."""
+    model_config = _MODEL_CONFIG
+
     id: int
     org_id: int
     org: Organization | None = None
@@ -105,8 +84,8 @@ class Network(BaseModel):
     policy_ratio: bool = False
     policy_contracts: str = ""
     notes: str = ""
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
     @property
@@ -114,7 +93,7 @@ class Network(BaseModel):
         """Check if network has open peering policy."""
         return self.policy_general.lower() == "open"
 
-    @property
+    @cached_property
     def total_prefixes(self) -> int:
         """Total announced prefixes (v4 + v6)."""
         return (self.info_prefixes4 or 0) + (self.info_prefixes6 or 0)
@@ -122,6 +101,8 @@ class Network(BaseModel):
 
 class Facility(BaseModel):
     """PeeringDB facility (data center)."""
+    model_config = _MODEL_CONFIG
+
     id: int
     org_id: int
     org: Organization | None = None
@@ -147,13 +128,15 @@ class Facility(BaseModel):
     latitude: float | None = None
     longitude: float | None = None
     notes: str = ""
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 class InternetExchange(BaseModel):
     """PeeringDB Internet Exchange."""
+    model_config = _MODEL_CONFIG
+
     id: int
     org_id: int
     org: Organization | None = None
@@ -175,12 +158,12 @@ class InternetExchange(BaseModel):
     policy_email: str = ""
     policy_phone: str = ""
     ixf_net_count: int = 0
-    ixf_last_import: datetime | None = None
-    created: datetime | None = None
-    updated: datetime | None = None
+    ixf_last_import: str | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
-    @property
+    @cached_property
     def member_count(self) -> int:
         """Number of members at this IX."""
         return self.ixf_net_count
@@ -188,6 +171,8 @@ class InternetExchange(BaseModel):
 
 class IXLan(BaseModel):
     """IX LAN (peering LAN at an IX)."""
+    model_config = _MODEL_CONFIG
+
     id: int
     ix_id: int
     name: str = ""
@@ -199,25 +184,29 @@ class IXLan(BaseModel):
     arp_sponge: str | None = None
     ixf_ixp_member_list_url: str | None = None
     ixf_ixp_member_list_url_visible: str = ""
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 class IXLanPrefix(BaseModel):
     """IP prefix used on an IX LAN."""
+    model_config = _MODEL_CONFIG
+
     id: int
     ixlan_id: int
     protocol: str  # "IPv4" or "IPv6"
     prefix: str
     in_dfz: bool = False
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 class NetworkIXLan(BaseModel):
     """Network's connection to an IX (netixlan)."""
+    model_config = _MODEL_CONFIG
+
     id: int
     net_id: int
     ix_id: int
@@ -230,11 +219,11 @@ class NetworkIXLan(BaseModel):
     ipaddr6: str | None = None
     is_rs_peer: bool = False
     operational: bool = True
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
-    @property
+    @cached_property
     def speed_gbps(self) -> float:
         """Port speed in Gbps."""
         return self.speed / 1000 if self.speed else 0
@@ -242,6 +231,8 @@ class NetworkIXLan(BaseModel):
 
 class NetworkFacility(BaseModel):
     """Network's presence at a facility."""
+    model_config = _MODEL_CONFIG
+
     id: int
     net_id: int
     fac_id: int
@@ -252,13 +243,15 @@ class NetworkFacility(BaseModel):
     avail_sonet: bool = False
     avail_ethernet: bool = False
     avail_atm: bool = False
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 class NetworkContact(BaseModel):
     """Network contact information."""
+    model_config = _MODEL_CONFIG
+
     id: int
     net_id: int
     role: str = ""
@@ -267,46 +260,112 @@ class NetworkContact(BaseModel):
     phone: str = ""
     email: str = ""
     url: str = ""
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 class IXFacility(BaseModel):
     """IX presence at a facility."""
+    model_config = _MODEL_CONFIG
+
     id: int
     ix_id: int
     fac_id: int
     name: str = ""
     city: str = ""
     country: str = ""
-    created: datetime | None = None
-    updated: datetime | None = None
+    created: str | None = None
+    updated: str | None = None
     status: str = "ok"
 
 
 # Response containers
+#
+# ``from_api`` builds a container straight from a PeeringDB response with
+# ``model_construct``, skipping per-field validation. Only use it for API
+# payloads, whose schema is stable; other input should go through the
+# validating constructor. PeeringDB sends ``null`` for some unset string
+# fields, so a null is replaced with the field's default.
+
+def _construct_trusted(model: type[_M], fields: dict[str, Any], row: dict[str, Any]) -> _M:
+    return model.model_construct(**{
+        k: default if (value := row[k]) is None else value
+        for k, default in fields.items() if k in row
+    })
+
+
+def _trusted_fields(model: type[BaseModel]) -> dict[str, Any]:
+    """Map ``model``'s field names to the value that stands in for a null.
+
+    Required fields map to None (kept as sent). Nested ``org`` objects are
+    left out: they only appear with ``depth`` > 0 and would stay raw dicts
+    under ``model_construct``.
+    """
+    return {
+        name: None if info.is_required() else info.get_default(call_default_factory=True)
+        for name, info in model.model_fields.items()
+        if name != "org"
+    }
+
+
+_NETWORK_FIELDS = _trusted_fields(Network)
+_FACILITY_FIELDS = _trusted_fields(Facility)
+_IX_FIELDS = _trusted_fields(InternetExchange)
+
 
 class NetworkList(BaseModel):
     """List of networks."""
+    model_config = _MODEL_CONFIG
+
     data: list[Network] = Field(default_factory=list)
     meta: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> NetworkList:
+        """Build from a PeeringDB ``net`` response without validation."""
+        return cls.model_construct(
+            data=[_construct_trusted(Network, _NETWORK_FIELDS, row) for row in payload.get("data", [])],
+            meta=payload.get("meta", {}),
+        )
+
 
 class FacilityList(BaseModel):
     """List of facilities."""
+    model_config = _MODEL_CONFIG
+
     data: list[Facility] = Field(default_factory=list)
     meta: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> FacilityList:
+        """Build from a PeeringDB ``fac`` response without validation."""
+        return cls.model_construct(
+            data=[_construct_trusted(Facility, _FACILITY_FIELDS, row) for row in payload.get("data", [])],
+            meta=payload.get("meta", {}),
+        )
+
 
 class IXList(BaseModel):
     """List of Internet Exchanges."""
+    model_config = _MODEL_CONFIG
+
     data: list[InternetExchange] = Field(default_factory=list)
     meta: dict[str, Any] = Field(default_factory=dict)
 
+    @classmethod
+    def from_api(cls, payload: dict[str, Any]) -> IXList:
+        """Build from a PeeringDB ``ix`` response without validation."""
+        return cls.model_construct(
+            data=[_construct_trusted(InternetExchange, _IX_FIELDS, row) for row in payload.get("data", [])],
+            meta=payload.get("meta", {}),
+        )
+
 
 class NetworkPresence(BaseModel):
     """Summary of a network's presence."""
+    model_config = _MODEL_CONFIG
+
     asn: int
     name: str
     ix_count: int = 0
@@ -318,6 +377,8 @@ class NetworkPresence(BaseModel):
 
 class CommonIX(BaseModel):
     """Common IX between two networks."""
+    model_config = _MODEL_CONFIG
+
     ix: InternetExchange
     net1_connection: NetworkIXLan
     net2_connection: NetworkIXLan
@@ -325,13 +386,14 @@ class CommonIX(BaseModel):
     @property
     def can_peer(self) -> bool:
         """Check if both have IPs on same address family."""
-        has_v4 = (self.net1_connection.ipaddr4 and self.net2_connection.ipaddr4)
-        has_v6 = (self.net1_connection.ipaddr6 and self.net2_connection.ipaddr6)
-        return has_v4 or has_v6
+        a, b = self.net1_connection, self.net2_connection
+        return bool((a.ipaddr4 and b.ipaddr4) or (a.ipaddr6 and b.ipaddr6))
 
 
 class PeeringOpportunity(BaseModel):
     """Potential peering opportunity between two ASNs."""
+    model_config = _MODEL_CONFIG
+
     asn1: int
     asn2: int
     net1_name: str = ""
@@ -5,10 +5,38 @@ Pydantic models for RIPEstat Data API responses.
 """
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any
+from functools import cached_property
+from typing import Any, TypeVar
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, model_validator
+from pydantic.dataclasses import dataclass
+
+_M = TypeVar("_M", bound=BaseModel)
+
+# Shared config for the API response models. Instances are read-only
+# snapshots of upstream data; schemas are built on first use rather than
+# at import; unknown API fields are dropped.
+_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+# Bulk leaf records that are only ever built by validating their parent
+# are slotted dataclasses: no per-instance __dict__ or pydantic bookkeeping.
+_leaf = dataclass(slots=True, frozen=True, config=ConfigDict(extra="ignore", defer_build=True))
+
+
+def _construct_rows(model: type[_M], fields: tuple[str, ...], rows: Any) -> Any:
+    """Build list items from trusted RIPEstat rows with ``model_construct``.
+
+    Only for the opt-in ``from_api`` constructors; values are stored as-is,
+    without coercion or required-field checks. Anything other than a list
+    of dicts is returned unchanged.
+    """
+    if not isinstance(rows, list):
+        return rows
+    return [
+        model.model_construct(**{k: row[k] for k in fields if k in row})
+        if type(row) is dict else row
+        for row in rows
+    ]
 
 
 class RIPEstatResponse(BaseModel):
@@ -33,6 +61,8 @@ class RIPEstatResponse(BaseModel):
 
 class ASOverview(BaseModel):
     """AS overview information."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     holder: str | None = None
     announced: bool = False
@@ -43,6 +73,8 @@ class ASOverview(BaseModel):
 
 class RoutingStatus(BaseModel):
     """Current routing status for a resource."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_time: str = ""
     observed_neighbours: int = 0
@@ -53,6 +85,8 @@ class RoutingStatus(BaseModel):
 
 class RoutingHistoryEntry(BaseModel):
     """Single entry in routing history."""
+    model_config = _MODEL_CONFIG
+
     origin: int | None = None
     path: str | None = None
     primary: dict[str, Any] | None = None
@@ -60,6 +94,8 @@ class RoutingHistoryEntry(BaseModel):
 
 class RoutingHistory(BaseModel):
     """Historical routing information."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_starttime: str = ""
     query_endtime: str = ""
@@ -69,6 +105,8 @@ class RoutingHistory(BaseModel):
 
 class BGPUpdate(BaseModel):
     """Single BGP update event."""
+    model_config = _MODEL_CONFIG
+
     timestamp: str = ""
     type: str = ""  # A=announcement, W=withdrawal
     attrs: dict[str, Any] | None = None
@@ -76,17 +114,32 @@ class BGPUpdate(BaseModel):
     path: list[int] = Field(default_factory=list)
 
 
+_BGP_UPDATE_FIELDS = tuple(BGPUpdate.model_fields)
+
+
 class BGPUpdates(BaseModel):
     """BGP update activity."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_starttime: str = ""
     query_endtime: str = ""
     updates: list[BGPUpdate] = Field(default_factory=list)
     nr_updates: int = 0
 
+    @classmethod
+    def from_api(cls, data: dict[str, Any]) -> BGPUpdates:
+        """Build from a trusted ``bgp-updates`` payload without validation."""
+        fields = {k: data[k] for k in cls.model_fields if k in data}
+        if "updates" in fields:
+            fields["updates"] = _construct_rows(BGPUpdate, _BGP_UPDATE_FIELDS, fields["updates"])
+        return cls.model_construct(**fields)
+
 
 class BGPUpdateActivitySample(BaseModel):
     """One histogram bin from bgp-update-activity."""
+    model_config = _MODEL_CONFIG
+
     starttime: str = ""
     announcements: int | None = 0
     withdrawals: int | None = 0
@@ -95,6 +148,8 @@ class BGPUpdateActivitySample(BaseModel):
 class BGPUpdateActivity(BaseModel):
     """Histogrammed BGP update activity. Scales to multi-day windows where
     bgp-updates 502s on high-volume ASNs."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_starttime: str = ""
     query_endtime: str = ""
@@ -107,33 +162,53 @@ class BGPUpdateActivity(BaseModel):
         return sum((s.announcements or 0) + (s.withdrawals or 0) for s in self.updates)
 
 
-class Prefix(BaseModel):
+@_leaf
+class Prefix:
     """Announced prefix."""
+
     prefix: str = ""
     timelines: list[dict[str, Any]] = Field(default_factory=list)
 
 
 class AnnouncedPrefixes(BaseModel):
     """All prefixes announced by an ASN."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_time: str = ""
     prefixes: list[Prefix] = Field(default_factory=list)
 
+    @cached_property
+    def _by_family(self) -> tuple[list[str], list[str]]:
+        # One pass fills both lists on first access; callers typically
+        # read ipv4_prefixes and ipv6_prefixes together.
+        ipv4: list[str] = []
+        ipv6: list[str] = []
+        for p in self.prefixes:
+            prefix = p.prefix
+            if "." in prefix:
+                ipv4.append(prefix)
+            if ":" in prefix:
+                ipv6.append(prefix)
+        return ipv4, ipv6
+
     @property
     def ipv4_prefixes(self) -> list[str]:
-        return [p.prefix for p in self.prefixes if "." in p.prefix]
+        return self._by_family[0]
 
     @property
     def ipv6_prefixes(self) -> list[str]:
-        return [p.prefix for p in self.prefixes if ":" in p.prefix]
+        return self._by_family[1]
 
-    @property
+    @cached_property
     def prefix_count(self) -> int:
         return len(self.prefixes)
 
 
 class ASPathLengthEntry(BaseModel):
     """Path length statistics entry."""
+    model_config = _MODEL_CONFIG
+
     count: int = 0
     stripped: int = 0
     unstripped: int = 0
@@ -141,13 +216,17 @@ class ASPathLengthEntry(BaseModel):
 
 class ASPathLength(BaseModel):
     """AS path length statistics."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_time: str = ""
     stats: list[dict[str, Any]] = Field(default_factory=list)
 
 
-class ROA(BaseModel):
+@_leaf
+class ROA:
     """RPKI ROA entry."""
+
     origin: str = ""
     prefix: str = ""
     max_length: int = 0
@@ -156,6 +235,8 @@ class ROA(BaseModel):
 
 class RPKIValidation(BaseModel):
     """RPKI validation status."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     prefix: str = ""
     status: str = ""  # valid, invalid, not-found
@@ -166,6 +247,8 @@ class RPKIValidation(BaseModel):
 
 class Neighbour(BaseModel):
     """AS neighbour."""
+    model_config = _MODEL_CONFIG
+
     asn: int
     name: str = ""
     power: int = 0
@@ -175,6 +258,8 @@ class Neighbour(BaseModel):
 
 class ASNeighbours(BaseModel):
     """Neighbouring ASes."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_time: str = ""
     neighbour_counts: dict[str, int] = Field(default_factory=dict)
@@ -187,9 +272,12 @@ class ASNeighbours(BaseModel):
     right: list[Neighbour] = Field(default_factory=list)
     uncertain: list[Neighbour] = Field(default_factory=list)
 
-    def __init__(self, **data):
-        super().__init__(**data)
-        # Parse neighbours into categories if raw neighbours provided
+    @model_validator(mode="after")
+    def _categorize_after_validation(self) -> ASNeighbours:
+        return self.categorize()
+
+    def categorize(self) -> ASNeighbours:
+        """Split raw neighbours into upstreams/downstreams if not yet done."""
         if self.neighbours and not self.upstreams:
             for n in self.neighbours:
                 # This is a simplified heuristic
@@ -197,10 +285,13 @@ class ASNeighbours(BaseModel):
                     self.upstreams.append(n)
                 else:
                     self.downstreams.append(n)
+        return self
 
 
 class RRCPeer(BaseModel):
     """Peer at a Route Reflector Client."""
+    model_config = _MODEL_CONFIG
+
     asn: int = 0
     ip: str = ""
     prefix: str = ""
@@ -211,6 +302,8 @@ class RRCPeer(BaseModel):
 
 class RRC(BaseModel):
     """Route Reflector Client data."""
+    model_config = _MODEL_CONFIG
+
     rrc: str = ""
     location: str = ""
     peers: list[RRCPeer] = Field(default_factory=list)
@@ -218,6 +311,8 @@ class RRC(BaseModel):
 
 class LookingGlass(BaseModel):
     """Looking glass query results."""
+    model_config = _MODEL_CONFIG
+
     resource: str = ""
     query_time: str = ""
     rrcs: list[RRC] = Field(default_factory=list)
@@ -5,9 +5,14 @@ Uses Claude to generate human-readable reports from raw BGP data.
 """
 from __future__ import annotations
 
+import asyncio
 import os
-from datetime import datetime
-from typing import Any
+from collections import Counter
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from datetime import datetime
 
 INCIDENT_PROMPT = """You are a network engineer analyzing a BGP routing incident.
 
@@ -85,6 +90,17 @@ DATA:
 
 Write your risk assessment:"""
 
+# The built-in prompts split once around their single {data} placeholder, so
+# filling one is a join rather than a str.format parse of the template.
+_PROMPT_PARTS: dict[str, tuple[str, ...]] = {
+    prompt: tuple(prompt.split("{data}"))
+    for prompt in (INCIDENT_PROMPT, PEERING_PROMPT, INVESTIGATION_PROMPT, PEER_RISK_PROMPT)
+}
+
+
+# Indent prefixes for _format_lines; deeper levels are built on demand.
+_INDENT = tuple("  " * i for i in range(16))
+
 
 class Synthesizer:
     """
@@ -98,6 +114,8 @@ class Synthesizer:
         print(report)
     """
 
+    MAX_CONCURRENT = 4
+
     def __init__(self, api_key: str | None = None, model: str = "claude-sonnet-4-20250514"):
         """
         Initialize synthesizer.
@@ -109,20 +127,46 @@ class Synthesizer:
         self.api_key = api_key or os.environ.get("ANTHROPIC_API_KEY")
         self.model = model
         self._client = None
+        self._client_loop: asyncio.AbstractEventLoop | None = None
+
+    async def __aenter__(self) -> "Synthesizer":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
 
     def _get_client(self):
-        """Lazy-load Anthropic client."""
-        if self._client is None:
+        """
+        Lazy-load the AsyncAnthropic client.
+
+        The client is reused across calls on this synthesizer. Its connection
+        pool is bound to the event loop it first ran on, so a call from a new
+        loop (e.g. a second asyncio.run) replaces it with a fresh client.
+        """
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop:
             try:
                 import anthropic
-                self._client = anthropic.Anthropic(api_key=self.api_key)
             except ImportError:
                 raise ImportError(
                     "anthropic package required for AI synthesis. "
                     "Install with: pip install 'route-sherlock[ai]'"
                 )
+            self._client = anthropic.AsyncAnthropic(
+                api_key=self.api_key,
+                max_retries=2,
+                timeout=60.0,
+            )
+            self._client_loop = loop
         return self._client
 
+    async def aclose(self) -> None:
+        """Close the cached client, if one is open on the running loop."""
+        client, loop = self._client, self._client_loop
+        self._client = self._client_loop = None
+        if client is not None and loop is asyncio.get_running_loop():
+            await client.close()
+
     async def synthesize(self, prompt: str, data: dict[str, Any]) -> str:
         """
         Generate synthesis from data using Claude.
@@ -137,14 +181,16 @@ class Synthesizer:
         if not self.api_key:
             return self._fallback_synthesis(data)
 
+        # Raises ImportError with install instructions if the extra is missing.
         client = self._get_client()
 
         # Format data for prompt
         data_str = self._format_data(data)
-        full_prompt = prompt.format(data=data_str)
+        parts = _PROMPT_PARTS.get(prompt)
+        full_prompt = data_str.join(parts) if parts else prompt.format(data=data_str)
 
         try:
-            message = client.messages.create(
+            message = await client.messages.create(
                 model=self.model,
                 max_tokens=2000,
                 messages=[
@@ -167,20 +213,60 @@ class Synthesizer:
         """Generate investigation analysis from data."""
         return await self.synthesize(INVESTIGATION_PROMPT, data)
 
+    async def synthesize_many(self, items: list[tuple[str, dict[str, Any]]]) -> list[str]:
+        """
+        Run several syntheses concurrently over the shared client.
+
+        A client opened for the batch is closed when it finishes; one that
+        was already open (e.g. under ``async with``) is left open.
+
+        Args:
+            items: (prompt, data) pairs, as passed to synthesize()
+
+        Returns:
+            Generated text for each item, in input order
+        """
+        sem = asyncio.Semaphore(self.MAX_CONCURRENT)
+        owns_client = self._client is None or self._client_loop is not asyncio.get_running_loop()
+
+        async def one(prompt: str, data: dict[str, Any]) -> str:
+            async with sem:
+                return await self.synthesize(prompt, data)
+
+        try:
+            return list(await asyncio.gather(*(one(p, d) for p, d in items)))
+        finally:
+            if owns_client:
+                await self.aclose()
+
     def _format_data(self, data: dict[str, Any], indent: int = 0) -> str:
         """Format nested data structure for prompt."""
-        lines = []
-        prefix = "  " * indent
+        lines: list[str] = []
+        self._format_lines(data, indent, lines)
+        return "\n".join(lines)
+
+    def _format_lines(self, data: dict[str, Any], indent: int, lines: list[str]) -> None:
+        """Append the formatted lines for ``data`` to ``lines``.
+
+        All nesting levels write into the same list, so the text is joined
+        once instead of once per level.
+        """
+        if not data:
+            # An empty mapping renders as one blank line.
+            lines.append("")
+            return
+
+        prefix = _INDENT[indent] if indent < len(_INDENT) else "  " * indent
 
         for key, value in data.items():
             if isinstance(value, dict):
                 lines.append(f"{prefix}{key}:")
-                lines.append(self._format_data(value, indent + 1))
+                self._format_lines(value, indent + 1, lines)
             elif isinstance(value, list):
                 lines.append(f"{prefix}{key}:")
-                for item in value[:20]:  # Limit list items
+                for item in islice(value, 20):  # Limit list items
                     if isinstance(item, dict):
-                        lines.append(self._format_data(item, indent + 1))
+                        self._format_lines(item, indent + 1, lines)
                     else:
                         lines.append(f"{prefix}  - {item}")
                 if len(value) > 20:
@@ -188,8 +274,6 @@ class Synthesizer:
             else:
                 lines.append(f"{prefix}{key}: {value}")
 
-        return "\n".join(lines)
-
     def _fallback_synthesis(self, data: dict[str, Any]) -> str:
         """Generate basic synthesis without AI."""
         lines = ["## Summary (AI synthesis unavailable)", ""]
@@ -235,6 +319,7 @@ class IncidentSynthesizer(Synthesizer):
         Returns:
             Formatted incident report
         """
+        update_types = Counter(u.get("type") for u in updates)
         data = {
             "asn": asn,
             "timeframe": {
@@ -244,8 +329,8 @@ class IncidentSynthesizer(Synthesizer):
             },
             "bgp_updates": {
                 "total_count": len(updates),
-                "announcements": sum(1 for u in updates if u.get("type") == "A"),
-                "withdrawals": sum(1 for u in updates if u.get("type") == "W"),
+                "announcements": update_types["A"],
+                "withdrawals": update_types["W"],
                 "sample_events": updates[:10],
             },
             "routing_history": history,
@@ -0,0 +1,153 @@
+"""Tests for model construction shortcuts and derived properties."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from route_sherlock.models.atlas import Probe, ProbeStatusInfo
+from route_sherlock.models.peeringdb import (
+    CommonIX,
+    InternetExchange,
+    Network,
+    NetworkIXLan,
+    NetworkList,
+    to_datetime,
+)
+from route_sherlock.models.ripestat import (
+    RRC,
+    AnnouncedPrefixes,
+    ASNeighbours,
+    BGPUpdate,
+    BGPUpdates,
+)
+
+
+def test_network_list_from_api_matches_validated_models():
+    row = {
+        "id": 1, "org_id": 2, "name": "Example", "asn": 64500,
+        "info_prefixes4": 10, "policy_general": "Open",
+        "created": "2020-01-01T00:00:00Z", "updated": "2021-02-03T04:05:06Z",
+        "not_a_model_field": "ignored",
+    }
+
+    trusted = NetworkList.from_api({"data": [row], "meta": {"count": 1}})
+
+    assert trusted.meta == {"count": 1}
+    assert trusted.data == [Network(**row)]
+
+
+def test_network_list_from_api_replaces_nulls_with_defaults():
+    row = {
+        "id": 1, "org_id": 2, "name": "Example", "asn": 64500,
+        "policy_general": None, "info_type": None, "info_prefixes4": None,
+        "created": None,
+    }
+
+    network = NetworkList.from_api({"data": [row]}).data[0]
+
+    assert network.policy_general == ""
+    assert network.is_open_peering is False
+    assert network.info_type == ""
+    assert network.total_prefixes == 0
+    assert network.created is None
+    assert network == Network(**{k: v for k, v in row.items() if v is not None})
+
+
+def test_bgp_updates_from_api_matches_validated_models():
+    row = {"type": "A", "timestamp": "2025-01-01T00:00:00", "source_id": "rrc00-1",
+           "attrs": {"path": [64500, 64501]}, "seq": 7}
+    payload = {"resource": "AS64500", "updates": [row], "nr_updates": 1}
+
+    trusted = BGPUpdates.from_api(payload)
+
+    assert trusted == BGPUpdates.model_validate(payload)
+    assert trusted.updates[0] == BGPUpdate.model_validate(row)
+
+
+def test_validation_still_checks_list_items():
+    with pytest.raises(ValidationError):
+        ASNeighbours.model_validate({"neighbours": [{"power": 5}]})
+
+    neighbours = ASNeighbours.model_validate({"neighbours": [{"asn": "1", "power": "5"}]})
+    assert neighbours.upstreams[0].asn == 1
+
+    rrc = RRC.model_validate({"peers": [{"asn": "3333"}]})
+    assert rrc.peers[0].asn == 3333
+
+
+def test_announced_prefixes_split_by_family():
+    payload = {"prefixes": [
+        {"prefix": "192.0.2.0/24"}, {"prefix": "2001:db8::/32"}, {"prefix": "198.51.100.0/24"},
+    ]}
+    prefixes = AnnouncedPrefixes.model_validate(payload)
+
+    assert prefixes.ipv4_prefixes == ["192.0.2.0/24", "198.51.100.0/24"]
+    assert prefixes.ipv6_prefixes == ["2001:db8::/32"]
+    assert prefixes.ipv4_prefixes is prefixes.ipv4_prefixes
+    assert prefixes == AnnouncedPrefixes.model_validate(payload)
+
+
+def test_can_peer_requires_a_shared_address_family():
+    def conn(asn, v4=None, v6=None):
+        return NetworkIXLan(id=asn, net_id=asn, ix_id=1, ixlan_id=1, asn=asn,
+                            ipaddr4=v4, ipaddr6=v6)
+
+    ix = InternetExchange(id=1, org_id=1, name="IX")
+    both_v4 = CommonIX(ix=ix, net1_connection=conn(1, v4="192.0.2.1"),
+                       net2_connection=conn(2, v4="192.0.2.2"))
+    mismatched = CommonIX(ix=ix, net1_connection=conn(1, v4="192.0.2.1"),
+                          net2_connection=conn(2, v6="2001:db8::2"))
+    both_v6 = CommonIX(ix=ix, net1_connection=conn(1, v6="2001:db8::1"),
+                       net2_connection=conn(2, v6="2001:db8::2"))
+
+    assert [c.can_peer for c in (both_v4, mismatched, both_v6)] == [True, False, True]
+
+
+def test_as_neighbours_categorized_on_validation():
+    payload = {"neighbours": [{"asn": "1", "power": "5"}, {"asn": 2, "power": 0}]}
+
+    validated = ASNeighbours.model_validate(payload)
+
+    assert [n.asn for n in validated.upstreams] == [1]
+    assert [n.asn for n in validated.downstreams] == [2]
+
+
+def test_derived_values_are_cached_outside_model_fields():
+    network = Network(id=1, org_id=2, name="Example", asn=64500,
+                      info_prefixes4=10, info_prefixes6=5)
+
+    assert network.total_prefixes == 15
+    assert network.__dict__["total_prefixes"] == 15
+    assert "total_prefixes" not in network.model_dump()
+    assert network == Network(id=1, org_id=2, name="Example", asn=64500,
+                              info_prefixes4=10, info_prefixes6=5)
+
+
+def test_leaf_prefix_records_are_slotted_and_ignore_extra_keys():
+    prefixes = AnnouncedPrefixes.model_validate(
+        {"prefixes": [{"prefix": "192.0.2.0/24", "unexpected": 1}]}
+    )
+
+    prefix = prefixes.prefixes[0]
+    assert not hasattr(prefix, "__dict__")
+    assert prefixes.model_dump()["prefixes"] == [{"prefix": "192.0.2.0/24", "timelines": []}]
+
+
+def test_timestamps_stay_strings_until_parsed():
+    network = Network(id=1, org_id=2, name="Example", asn=64500,
+                      updated="2021-02-03T04:05:06Z")
+
+    assert network.updated == "2021-02-03T04:05:06Z"
+    assert to_datetime(network.updated) == datetime(2021, 2, 3, 4, 5, 6, tzinfo=UTC)
+    assert to_datetime(network.created) is None
+
+
+def test_probe_is_connected_follows_status_updates():
+    probe = Probe(id=1, status={"id": 1, "name": "Connected"})
+    assert probe.is_connected
+
+    assert not probe.model_copy(update={"status": ProbeStatusInfo(name="Disconnected")}).is_connected
+    probe.status = None
+    assert not probe.is_connected
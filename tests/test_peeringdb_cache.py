@@ -0,0 +1,310 @@
+"""Tests for PeeringDBClient response caching.
+
+Requests are served by an httpx.MockTransport so nothing touches the
+network; the handler records every URL it sees.
+"""
+from __future__ import annotations
+
+import asyncio
+import gc
+import time
+
+import httpx
+import pytest
+
+from route_sherlock.cache.store import MemoryCache
+from route_sherlock.collectors.peeringdb import (
+    PeeringDBAuthError,
+    PeeringDBClient,
+    PeeringDBNotFoundError,
+)
+
+
+class _Recorder:
+    def __init__(self, payload=None, status_code=200, headers=None):
+        self.payload = payload if payload is not None else {"data": [], "meta": {}}
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        return httpx.Response(self.status_code, json=self.payload, headers=self.headers)
+
+
+@pytest.fixture
+async def make_client():
+    clients = []
+
+    async def _make(handler, **kwargs) -> PeeringDBClient:
+        client = PeeringDBClient(**kwargs)
+        await client.__aenter__()
+        await client._client.aclose()
+        client._client = httpx.AsyncClient(
+            base_url=PeeringDBClient.BASE_URL + "/",
+            transport=httpx.MockTransport(handler),
+        )
+        clients.append(client)
+        return client
+
+    yield _make
+    for client in clients:
+        await client.__aexit__(None, None, None)
+
+
+def test_ttl_defaults_by_object_type():
+    client = PeeringDBClient()
+    assert client._ttl_for("org/1") == 7 * 86400
+    assert client._ttl_for("ix") == 3 * 86400
+    assert client._ttl_for("netixlan") < client._ttl_for("net") < PeeringDBClient.DEFAULT_CACHE_TTL
+    assert client._ttl_for("poc") == PeeringDBClient.DEFAULT_CACHE_TTL
+
+
+@pytest.mark.parametrize("cache_ttl", [0, 3600, 7 * 86400])
+def test_explicit_cache_ttl_replaces_ttl_table(cache_ttl):
+    client = PeeringDBClient(cache_ttl=cache_ttl)
+    assert client._ttl_for("org/1") == cache_ttl
+    assert client._ttl_for("ix") == cache_ttl
+    assert client._ttl_for("netixlan") == cache_ttl
+
+
+def test_ttl_overrides_merge_over_defaults():
+    client = PeeringDBClient(cache_ttl_overrides={"netixlan": 60, "org": 5})
+    assert client._ttl_for("netixlan") == 60
+    assert client._ttl_for("org/1") == 5
+    assert client._ttl_for("fac") == PeeringDBClient.DEFAULT_TTLS["fac"]
+
+    pinned = PeeringDBClient(cache_ttl=7 * 86400, cache_ttl_overrides={"netixlan": 60})
+    assert pinned._ttl_for("netixlan") == 60
+    assert pinned._ttl_for("fac") == 7 * 86400
+
+
+async def test_cached_response_skips_network(make_client):
+    handler = _Recorder()
+    client = await make_client(handler, cache=MemoryCache())
+
+    await client._request("net", {"asn": 16509})
+    await client._request("net", {"asn": 16509})
+
+    assert len(handler.requests) == 1
+
+
+async def test_concurrent_identical_requests_share_one_fetch(make_client):
+    handler = _Recorder()
+    client = await make_client(handler)
+
+    results = await asyncio.gather(
+        client._request("netixlan", {"asn": 16509}),
+        client._request("netixlan", {"asn": 16509}),
+        client._request("netixlan", {"asn": 13335}),
+    )
+
+    assert len(handler.requests) == 2
+    assert results[0] is results[1]
+    assert client._inflight == {}
+
+
+async def test_forced_refresh_does_not_join_inflight_request(make_client):
+    started, release = asyncio.Event(), asyncio.Event()
+    requests = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        n = len(requests)
+        if n == 1:
+            started.set()
+            await release.wait()
+        return httpx.Response(200, json={"data": [{"n": n}], "meta": {}})
+
+    client = await make_client(handler)
+
+    first = asyncio.ensure_future(client._request("net", {"asn": 16509}))
+    await started.wait()
+    refreshed = await client._request("net", {"asn": 16509}, use_cache=False)
+    release.set()
+
+    assert refreshed["data"] == [{"n": 2}]
+    assert (await first)["data"] == [{"n": 1}]
+    assert len(requests) == 2
+
+
+async def test_cancelled_sole_waiter_leaves_no_unretrieved_error(make_client):
+    started, release = asyncio.Event(), asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        started.set()
+        await release.wait()
+        return httpx.Response(403)
+
+    client = await make_client(handler)
+    loop = asyncio.get_running_loop()
+    unhandled = []
+    loop.set_exception_handler(lambda loop, context: unhandled.append(context))
+    try:
+        waiter = asyncio.ensure_future(client._request("net", {"asn": 16509}))
+        await started.wait()
+        (pending,) = client._inflight.values()
+        waiter.cancel()
+        release.set()
+        # asyncio.wait does not retrieve the exception; only _settle can.
+        await asyncio.wait({pending})
+        del pending, waiter
+        gc.collect()
+    finally:
+        loop.set_exception_handler(None)
+
+    assert client._inflight == {}
+    assert unhandled == []
+
+
+async def test_in_process_copy_skips_backing_cache(make_client):
+    class CountingCache(MemoryCache):
+        gets = 0
+
+        async def get(self, key):
+            CountingCache.gets += 1
+            return await super().get(key)
+
+    handler = _Recorder()
+    client = await make_client(handler, cache=CountingCache())
+
+    for _ in range(3):
+        await client._request("net", {"asn": 16509})
+
+    assert len(handler.requests) == 1
+    assert CountingCache.gets == 1
+
+
+async def test_in_process_copy_is_bounded(make_client, monkeypatch):
+    monkeypatch.setattr(PeeringDBClient, "MEMO_MAX_ENTRIES", 2)
+    client = await make_client(_Recorder(), cache=MemoryCache())
+
+    for asn in (1, 2, 3):
+        await client._request("net", {"asn": asn})
+
+    assert len(client._memo) == 2
+
+
+def test_cache_key_is_canonical_and_bounded():
+    a = PeeringDBClient._cache_key("net", {"asn": 1, "limit": 5})
+    b = PeeringDBClient._cache_key("net", {"limit": 5, "asn": 1})
+    long = PeeringDBClient._cache_key("net", {"name__contains": "x" * 500})
+
+    assert a == b
+    assert a.startswith("peeringdb:net:")
+    assert len(long) == len(a)
+    assert a != PeeringDBClient._cache_key("net", {"asn": 2, "limit": 5})
+    # A value carrying "&" or "=" must not collide with a two-parameter query.
+    assert PeeringDBClient._cache_key("net", {"asn": "1&limit=5"}) != a
+
+
+async def test_cache_miss_logs_original_query(make_client, caplog):
+    client = await make_client(_Recorder(), cache=MemoryCache())
+
+    with caplog.at_level("DEBUG", logger="route_sherlock.collectors.peeringdb"):
+        await client._request("net", {"asn": 16509})
+        await client._request("net", {"asn": 16509})
+
+    misses = [r.getMessage() for r in caplog.records if "cache miss" in r.getMessage()]
+    assert misses == [
+        f"PeeringDB cache miss: net {{'asn': 16509}} -> {client._cache_key('net', {'asn': 16509})}"
+    ]
+
+
+async def test_endpoint_resolves_against_api_base_url(make_client):
+    handler = _Recorder()
+    client = await make_client(handler)
+
+    await client._request("ix/26")
+
+    assert str(handler.requests[0].url) == "https://www.peeringdb.com/api/ix/26"
+
+
+async def test_bulk_in_queries_are_batched(make_client, monkeypatch):
+    monkeypatch.setattr(PeeringDBClient, "IN_QUERY_BATCH_SIZE", 2)
+    handler = _Recorder()
+    client = await make_client(handler)
+
+    await client._request_in("net", "asn", [5, 3, 1, 3, 2])
+
+    assert sorted(r.url.params["asn__in"] for r in handler.requests) == ["1,2", "3,5"]
+
+
+@pytest.mark.parametrize("status, exc_type", [
+    (401, PeeringDBAuthError),
+    (403, PeeringDBAuthError),
+    (404, PeeringDBNotFoundError),
+])
+async def test_client_errors_raise_without_retry(make_client, status, exc_type):
+    handler = _Recorder(status_code=status)
+    client = await make_client(handler)
+
+    with pytest.raises(exc_type):
+        await client._request("net/1")
+
+    assert len(handler.requests) == 1
+
+
+async def test_find_common_ixes_fetches_ix_details_in_bulk(make_client):
+    def _netixlan(asn, ix_id):
+        return {"id": asn * 100 + ix_id, "net_id": asn, "ix_id": ix_id,
+                "ixlan_id": ix_id, "asn": asn, "ipaddr4": "192.0.2.1"}
+
+    def _ix(ix_id):
+        return {"id": ix_id, "org_id": 1, "name": f"IX {ix_id}"}
+
+    routes = {
+        ("netixlan", "1"): [_netixlan(1, i) for i in (10, 11, 12)],
+        ("netixlan", "2"): [_netixlan(2, i) for i in (11, 12, 13)],
+        ("ix", None): [_ix(11), _ix(12)],
+    }
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        endpoint = request.url.path.rsplit("/", 1)[-1]
+        rows = routes[(endpoint, request.url.params.get("asn"))]
+        return httpx.Response(200, json={"data": rows, "meta": {}})
+
+    client = await make_client(handler)
+    common = await client.find_common_ixes(1, 2)
+
+    assert sorted(c.ix.id for c in common) == [11, 12]
+    assert len(seen) == 3
+    assert seen[-1].url.params["id__in"] == "11,12"
+
+
+async def test_expired_entry_is_revalidated_with_etag(make_client, monkeypatch):
+    payload = {"data": [{"id": 1}], "meta": {}}
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json=payload, headers={"ETag": '"v1"'})
+
+    client = await make_client(handler, cache=MemoryCache())
+    await client._request("net", {"asn": 1})
+
+    now = time.time()
+    monkeypatch.setattr(time, "time", lambda: now + client._ttl_for("net") + 1)
+    client._memo.clear()
+
+    assert await client._request("net", {"asn": 1}) == payload
+    assert len(seen) == 2
+    assert seen[1].headers["If-None-Match"] == '"v1"'
+
+
+async def test_not_found_is_negatively_cached(make_client):
+    handler = _Recorder(status_code=404)
+    client = await make_client(handler, cache=MemoryCache())
+
+    for _ in range(2):
+        with pytest.raises(PeeringDBNotFoundError):
+            await client._request("ix/999")
+    client._memo.clear()
+    with pytest.raises(PeeringDBNotFoundError):
+        await client._request("ix/999")
+
+    assert len(handler.requests) == 1
@@ -28,3 +28,14 @@ def test_retry_delay_ignores_garbage_retry_after():
     d = PeeringDBClient._retry_delay(attempt=1, retry_after="soon")
     # Falls back to exponential: 2^1 = 2.
     assert 2.0 <= d <= 2.5
+
+
+def test_retry_delay_scales_with_backoff_factor():
+    d = PeeringDBClient._retry_delay(attempt=2, backoff_factor=0.5)
+    # 0.5 * 2^2 = 2 plus jitter.
+    assert 2.0 <= d <= 2.5
+
+
+def test_retry_after_overrides_backoff_factor():
+    d = PeeringDBClient._retry_delay(attempt=2, retry_after="3", backoff_factor=10)
+    assert 3.0 <= d <= 3.5
@@ -0,0 +1,245 @@
+"""Tests for RIPEstatClient connection handling and request plumbing."""
+from __future__ import annotations
+
+import asyncio
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from route_sherlock.cache.store import MemoryCache
+from route_sherlock.collectors.ripestat import (
+    RIPEstatClient,
+    RIPEstatError,
+    RIPEstatRateLimitError,
+    _RateLimiter,
+)
+
+
+async def test_shared_http_client_is_reused_and_left_open():
+    shared = RIPEstatClient.build_http_client()
+    try:
+        async with RIPEstatClient(http_client=shared) as client:
+            assert client._client is shared
+        async with RIPEstatClient(http_client=shared) as client:
+            assert client._client is shared
+        assert not shared.is_closed
+    finally:
+        await shared.aclose()
+
+
+async def test_http_client_honours_proxy_environment(monkeypatch):
+    monkeypatch.setenv("HTTPS_PROXY", "http://proxy.example:3128")
+    client = RIPEstatClient.build_http_client()
+    try:
+        transport = client._transport_for_url(httpx.URL("https://stat.ripe.net/data/"))
+        assert transport is not client._transport
+    finally:
+        await client.aclose()
+
+
+async def test_rate_limiter_admits_burst_then_paces():
+    limiter = _RateLimiter(rate=50)
+    start = time.monotonic()
+    for _ in range(50):
+        await limiter.acquire()
+    assert time.monotonic() - start < 0.05
+
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.015
+
+
+async def test_rate_limiter_pause_holds_back_callers():
+    limiter = _RateLimiter(rate=50)
+    limiter.pause(0.05)
+    start = time.monotonic()
+    await limiter.acquire()
+    assert time.monotonic() - start >= 0.05
+
+
+async def test_clients_share_one_rate_limit():
+    class FastClient(RIPEstatClient):
+        RATE_LIMIT = 50
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"status": "ok", "data": {}})
+    ))
+    async with FastClient(http_client=http) as a, FastClient(http_client=http) as b:
+        assert a._limiter is b._limiter
+        start = time.monotonic()
+        await asyncio.gather(*(
+            client._request("as-overview", {"resource": f"AS{n}"}, use_cache=False)
+            for n in range(30)
+            for client in (a, b)
+        ))
+        elapsed = time.monotonic() - start
+    await http.aclose()
+
+    # 60 requests at 50/s with a burst of 50: the last 10 wait >= 0.2s.
+    assert elapsed >= 0.19
+
+
+def test_cache_key_is_canonical():
+    a = RIPEstatClient._cache_key("rpki-validation", {"resource": "AS1", "prefix": "192.0.2.0/24"})
+    b = RIPEstatClient._cache_key("rpki-validation", {"prefix": "192.0.2.0/24", "resource": "AS1"})
+
+    assert a == b == "ripestat:rpki-validation:prefix=192.0.2.0/24&resource=AS1"
+    assert RIPEstatClient._cache_key("as-overview", {"resource": "AS13335"}) == (
+        "ripestat:as-overview:resource=AS13335"
+    )
+    assert RIPEstatClient._cache_key("rpki-validation", {"prefix": "x&resource=AS1"}) != a
+
+
+async def test_upstream_asns_sorted_by_power(monkeypatch):
+    client = RIPEstatClient()
+
+    async def fake_neighbours(asn):
+        return SimpleNamespace(upstreams=[
+            SimpleNamespace(asn=1, power=5),
+            SimpleNamespace(asn=2, power=50),
+            SimpleNamespace(asn=3, power=5),
+        ])
+
+    monkeypatch.setattr(client, "get_as_neighbours", fake_neighbours)
+
+    assert await client.get_upstream_asns("AS64500") == [2, 1, 3]
+
+
+async def test_envelope_payload_is_returned_and_errors_raise():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params["resource"] == "AS1":
+            return httpx.Response(200, json={"status": "ok", "data": {"holder": "X"}})
+        return httpx.Response(200, json={
+            "status": "error", "status_code": 500, "data_call_status": "broken",
+        })
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with RIPEstatClient(http_client=http) as client:
+        assert await client._request("as-overview", {"resource": "AS1"}) == {"holder": "X"}
+        with pytest.raises(RIPEstatError, match="broken"):
+            await client._request("as-overview", {"resource": "AS2"})
+    await http.aclose()
+
+
+async def test_asn_bundle_issues_lookups_concurrently():
+    payloads = {
+        "as-overview": {"resource": "AS64500", "holder": "EXAMPLE"},
+        "routing-status": {"resource": "AS64500", "observed_neighbours": 3},
+        "announced-prefixes": {"prefixes": [{"prefix": "192.0.2.0/24"}, {"prefix": "2001:db8::/32"}]},
+        "asn-neighbours": {"neighbours": [
+            {"asn": 1, "power": 5}, {"asn": 2, "power": 9}, {"asn": 3, "power": 0},
+        ]},
+    }
+    in_flight = {"now": 0, "peak": 0}
+    release = asyncio.Event()
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight["now"] += 1
+        in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        if in_flight["peak"] == len(payloads):
+            release.set()
+        await asyncio.wait_for(release.wait(), 1)
+        in_flight["now"] -= 1
+        endpoint = request.url.path.split("/")[-2]
+        return httpx.Response(200, json={"status": "ok", "data": payloads[endpoint]})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with RIPEstatClient(http_client=http) as client:
+        bundle = await client.get_asn_bundle("64500")
+    await http.aclose()
+
+    assert in_flight["peak"] == 4
+    assert bundle["overview"].holder == "EXAMPLE"
+    assert bundle["routing_status"].observed_neighbours == 3
+    assert bundle["prefix_count"] == {"ipv4": 1, "ipv6": 1, "total": 2}
+    assert bundle["upstreams"] == [2, 1]
+
+
+def test_ttl_table_merges_overrides():
+    client = RIPEstatClient(cache_ttl_overrides={"looking-glass": 5})
+    assert client._ttl_for("as-overview") == RIPEstatClient.DEFAULT_TTLS["as-overview"]
+    assert client._ttl_for("routing-status") == RIPEstatClient.DEFAULT_TTLS["routing-status"]
+    assert client._ttl_for("looking-glass") == 5
+    assert client._ttl_for("announced-prefixes") == RIPEstatClient.DEFAULT_CACHE_TTL
+
+
+@pytest.mark.parametrize("cache_ttl", [0, 100, 7 * 86400])
+def test_explicit_cache_ttl_replaces_ttl_table(cache_ttl):
+    client = RIPEstatClient(cache_ttl=cache_ttl, cache_ttl_overrides={"routing-status": 600})
+    assert client._ttl_for("as-overview") == cache_ttl
+    assert client._ttl_for("looking-glass") == cache_ttl
+    assert client._ttl_for("rpki-validation") == cache_ttl
+    assert client._ttl_for("routing-status") == 600
+
+
+async def test_failures_are_negatively_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"status": "error", "status_code": 500})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with RIPEstatClient(cache=MemoryCache(), http_client=http) as client:
+        for _ in range(3):
+            with pytest.raises(RIPEstatError):
+                await client._request("as-overview", {"resource": "AS1"})
+    await http.aclose()
+
+    assert len(calls) == 1
+
+
+async def test_zero_cache_ttl_disables_negative_cache():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(200, json={"status": "error", "status_code": 500})
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with RIPEstatClient(cache=MemoryCache(), cache_ttl=0, http_client=http) as client:
+        for _ in range(3):
+            with pytest.raises(RIPEstatError):
+                await client._request("as-overview", {"resource": "AS1"})
+    await http.aclose()
+
+    assert len(calls) == 3
+
+
+async def test_uncached_failures_are_not_negatively_cached():
+    responses = iter([
+        httpx.Response(200, json={"status": "error", "status_code": 500}),
+        httpx.Response(200, json={"status": "ok", "data": {"resource": "1"}}),
+    ])
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: next(responses)))
+    async with RIPEstatClient(cache=MemoryCache(), http_client=http) as client:
+        with pytest.raises(RIPEstatError):
+            await client._request("as-overview", {"resource": "AS1"}, use_cache=False)
+        assert await client._request("as-overview", {"resource": "AS1"}) == {"resource": "1"}
+    await http.aclose()
+
+
+async def test_rate_limit_errors_are_not_negatively_cached():
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        return httpx.Response(429)
+
+    http = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    async with RIPEstatClient(cache=MemoryCache(), http_client=http, max_retries=1) as client:
+        for _ in range(2):
+            with pytest.raises(RIPEstatRateLimitError):
+                await client._request("as-overview", {"resource": "AS1"})
+    await http.aclose()
+
+    assert len(calls) == 2
+
+
+def test_time_params_snap_to_the_hour():
+    end = datetime(2025, 1, 2, 13, 47, 12)
+    params = RIPEstatClient._time_params(None, end, timedelta(hours=1))
+    assert params == {"starttime": "2025-01-02T12:00", "endtime": "2025-01-02T13:00"}
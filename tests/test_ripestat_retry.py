@@ -1,6 +1,9 @@
 """Unit tests for the RIPEstat retry/backoff helper."""
 from __future__ import annotations
 
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+
 from route_sherlock.collectors.ripestat import RIPEstatClient
 
 
@@ -22,3 +25,14 @@ def test_retry_delay_is_capped_at_30_seconds():
 def test_retry_delay_ignores_garbage_retry_after():
     d = RIPEstatClient._retry_delay(attempt=1, retry_after="soon")
     assert 2.0 <= d <= 2.5
+
+
+def test_retry_delay_accepts_http_date_retry_after():
+    when = datetime.now(timezone.utc) + timedelta(seconds=10)
+    d = RIPEstatClient._retry_delay(attempt=0, retry_after=format_datetime(when, usegmt=True))
+    assert 8.0 <= d <= 10.5
+
+
+def test_retry_delay_past_http_date_retries_immediately():
+    d = RIPEstatClient._retry_delay(attempt=3, retry_after="Wed, 21 Oct 2015 07:28:00 GMT")
+    assert 0.0 <= d <= 0.5
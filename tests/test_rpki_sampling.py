@@ -86,3 +86,27 @@ def test_no_sample_when_population_small(monkeypatch):
     # 3 < 8, so all three are validated.
     assert result["total_checked"] == 3
     assert len(result["valid"]) == 3
+
+
+def test_validations_run_concurrently_up_to_cap(monkeypatch):
+    client = RIPEstatClient()
+    monkeypatch.setattr(RIPEstatClient, "RPKI_CONCURRENCY", 3)
+
+    async def fake_prefixes(asn):
+        return _fake_prefixes(10)
+
+    active = {"now": 0, "peak": 0}
+
+    async def fake_validation(prefix, asn):
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0)
+        active["now"] -= 1
+        return RPKIValidation(prefix=prefix, status="valid")
+
+    monkeypatch.setattr(client, "get_announced_prefixes", fake_prefixes)
+    monkeypatch.setattr(client, "get_rpki_validation", fake_validation)
+
+    result = _run(client.check_rpki_status("AS64500"))
+    assert active["peak"] == 3
+    assert len(result["valid"]) == 10
@@ -0,0 +1,80 @@
+"""Tests for the synchronous client wrappers.
+
+The wrappers should hold one async client open on a background loop and
+reuse it across calls, instead of paying a fresh connection per call.
+"""
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from route_sherlock.collectors.peeringdb import PeeringDBClient, PeeringDBClientSync
+from route_sherlock.collectors.ripestat import RIPEstatClient, RIPEstatClientSync
+
+
+def test_peeringdb_sync_reuses_one_client(monkeypatch):
+    seen = []
+
+    async def fake_get_network_by_asn(self, asn):
+        seen.append(self._client)
+        return asn
+
+    monkeypatch.setattr(PeeringDBClient, "get_network_by_asn", fake_get_network_by_asn)
+
+    with PeeringDBClientSync() as client:
+        assert client.get_network_by_asn(16509) == 16509
+        assert client.get_network_by_asn(13335) == 13335
+
+    assert len(seen) == 2
+    assert seen[0] is seen[1]
+    assert seen[0].is_closed
+
+
+def test_peeringdb_sync_passes_kwargs_through(monkeypatch):
+    async def fake_get_network_by_asn(self, asn):
+        return self.api_key
+
+    monkeypatch.setattr(PeeringDBClient, "get_network_by_asn", fake_get_network_by_asn)
+
+    with PeeringDBClientSync(api_key="secret") as client:
+        assert client.get_network_by_asn(16509) == "secret"
+
+
+def test_ripestat_sync_reuses_one_client_with_kwargs(monkeypatch):
+    seen = []
+
+    async def fake_get_as_overview(self, asn):
+        seen.append((self._client, self.timeout))
+        return asn
+
+    monkeypatch.setattr(RIPEstatClient, "get_as_overview", fake_get_as_overview)
+
+    with RIPEstatClientSync(timeout=5.0) as client:
+        assert client.get_as_overview("AS16509") == "AS16509"
+        assert client.get_as_overview("AS13335") == "AS13335"
+
+    assert seen[0][0] is seen[1][0]
+    assert seen[0][1] == 5.0
+    assert seen[0][0].is_closed
+
+
+def test_sync_wrapper_builds_one_client_under_concurrent_first_calls(monkeypatch):
+    entered = []
+    original_aenter = PeeringDBClient.__aenter__
+
+    async def slow_aenter(self):
+        entered.append(self)
+        await asyncio.sleep(0.05)
+        return await original_aenter(self)
+
+    async def fake_get_network_by_asn(self, asn):
+        return asn
+
+    monkeypatch.setattr(PeeringDBClient, "__aenter__", slow_aenter)
+    monkeypatch.setattr(PeeringDBClient, "get_network_by_asn", fake_get_network_by_asn)
+
+    with PeeringDBClientSync() as client, ThreadPoolExecutor(4) as pool:
+        results = list(pool.map(client.get_network_by_asn, range(4)))
+
+    assert results == [0, 1, 2, 3]
+    assert len(entered) == 1
@@ -0,0 +1,168 @@
+"""Tests for the prompt-building side of the synthesis engine.
+
+None of these call the Anthropic API.
+"""
+from __future__ import annotations
+
+import asyncio
+import sys
+from datetime import datetime, timedelta
+
+import pytest
+
+from route_sherlock.synthesis.engine import (
+    _PROMPT_PARTS,
+    INCIDENT_PROMPT,
+    INVESTIGATION_PROMPT,
+    PEER_RISK_PROMPT,
+    PEERING_PROMPT,
+    IncidentSynthesizer,
+    Synthesizer,
+)
+
+
+def test_format_data_renders_nested_structures():
+    data = {
+        "asn": 64500,
+        "timeframe": {"start": "s", "end": "e"},
+        "events": [{"type": "A"}, "raw"],
+        "empty": {},
+        "many": list(range(22)),
+    }
+
+    assert Synthesizer()._format_data(data) == "\n".join([
+        "asn: 64500",
+        "timeframe:",
+        "  start: s",
+        "  end: e",
+        "events:",
+        "  type: A",
+        "  - raw",
+        "empty:",
+        "",
+        "many:",
+        *(f"  - {i}" for i in range(20)),
+        "  ... and 2 more",
+    ])
+
+
+@pytest.mark.parametrize("prompt", [
+    INCIDENT_PROMPT, PEERING_PROMPT, INVESTIGATION_PROMPT, PEER_RISK_PROMPT,
+])
+def test_prompt_parts_match_format(prompt):
+    data = "asn: 64500\nnote: {not a placeholder}"
+    assert data.join(_PROMPT_PARTS[prompt]) == prompt.format(data=data)
+
+
+async def test_incident_update_counts(monkeypatch):
+    captured = {}
+
+    async def fake_synthesize_incident(self, data):
+        captured.update(data)
+        return ""
+
+    monkeypatch.setattr(IncidentSynthesizer, "synthesize_incident", fake_synthesize_incident)
+    updates = [{"type": "A"}, {"type": "W"}, {"type": "A"}, {}]
+    start = datetime(2025, 1, 1)
+
+    await IncidentSynthesizer().synthesize_from_raw(
+        "AS64500", updates, None, start, start + timedelta(hours=1),
+    )
+
+    counts = captured["bgp_updates"]
+    assert (counts["total_count"], counts["announcements"], counts["withdrawals"]) == (4, 2, 1)
+
+
+def _mock_anthropic(monkeypatch):
+    """Build real AsyncAnthropic clients over an httpx MockTransport."""
+    anthropic = pytest.importorskip("anthropic")
+    try:
+        # Newer SDKs ship their own httpx fork and reject plain httpx clients.
+        import httpx2 as sdk_httpx
+    except ImportError:
+        import httpx as sdk_httpx
+    http_clients = []
+
+    def handler(request):
+        return sdk_httpx.Response(200, json={
+            "id": "msg_1",
+            "type": "message",
+            "role": "assistant",
+            "model": "m",
+            "content": [{"type": "text", "text": "report"}],
+            "stop_reason": "end_turn",
+            "stop_sequence": None,
+            "usage": {"input_tokens": 1, "output_tokens": 1},
+        })
+
+    real = anthropic.AsyncAnthropic
+
+    def factory(**kwargs):
+        http_client = sdk_httpx.AsyncClient(transport=sdk_httpx.MockTransport(handler))
+        http_clients.append(http_client)
+        return real(http_client=http_client, **kwargs)
+
+    monkeypatch.setattr(anthropic, "AsyncAnthropic", factory)
+    return http_clients
+
+
+async def test_synthesizer_reuses_client_within_a_loop(monkeypatch):
+    http_clients = _mock_anthropic(monkeypatch)
+
+    async with Synthesizer(api_key="k") as synth:
+        first = await synth.synthesize_incident({"asn": 1})
+        second = await synth.synthesize_peering({"asn": 2})
+
+    assert (first, second) == ("report", "report")
+    assert len(http_clients) == 1
+    assert http_clients[0].is_closed
+
+
+def test_synthesizer_survives_separate_event_loops(monkeypatch):
+    http_clients = _mock_anthropic(monkeypatch)
+    synth = Synthesizer(api_key="k")
+
+    first = asyncio.run(synth.synthesize_incident({"asn": 1}))
+    second = asyncio.run(synth.synthesize_incident({"asn": 2}))
+
+    assert (first, second) == ("report", "report")
+    assert len(http_clients) == 2
+
+
+def test_synthesize_many_closes_its_client(monkeypatch):
+    http_clients = _mock_anthropic(monkeypatch)
+
+    results = asyncio.run(Synthesizer(api_key="k").synthesize_many(
+        [(INCIDENT_PROMPT, {"asn": n}) for n in range(3)]
+    ))
+
+    assert results == ["report"] * 3
+    assert len(http_clients) == 1
+    assert http_clients[0].is_closed
+
+
+async def test_missing_anthropic_raises_install_hint(monkeypatch):
+    monkeypatch.setitem(sys.modules, "anthropic", None)
+
+    with pytest.raises(ImportError, match=r"route-sherlock\[ai\]"):
+        await Synthesizer(api_key="k").synthesize_incident({"asn": 64500})
+
+
+async def test_synthesize_many_caps_concurrency_and_keeps_order(monkeypatch):
+    in_flight = peak = 0
+
+    async def fake_synthesize(self, prompt, data):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return f"{prompt}:{data['asn']}"
+
+    monkeypatch.setattr(Synthesizer, "synthesize", fake_synthesize)
+    items = [("p", {"asn": n}) for n in range(10)]
+
+    results = await Synthesizer().synthesize_many(items)
+
+    assert results == [f"p:{n}" for n in range(10)]
+    assert peak == Synthesizer.MAX_CONCURRENT